@@ -45,6 +45,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 
     # custom app
     "core",
@@ -52,6 +53,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -61,6 +63,9 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Requests slower than this (ms) are logged by RequestMetricsMiddleware.
+SLOW_REQUEST_MS = int(os.getenv("SLOW_REQUEST_MS", 1000))
+
 ROOT_URLCONF = "beccsite.urls"
 
 TEMPLATES = [
@@ -93,9 +98,49 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST'),
         'PORT': os.getenv('DB_PORT'),
+        # Async public views (ASYNC_VIEWS) run their queries on a pool of
+        # worker threads, each with its own connection. Keeping connections
+        # open for a minute lets those threads reuse them instead of
+        # connecting for every query. Set DB_CONN_MAX_AGE=0 when a pooler
+        # such as PgBouncer holds the server connections instead.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory by default, which is only correct for a single worker process:
+# the content and model versions that invalidate cached pages, fragments and
+# the organization snapshot live in this cache, so with several workers (or
+# management commands changing content) a shared backend is required, e.g.
+# CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+# CACHE_LOCATION=/var/tmp/becc_cache
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "becc"),
     }
 }
 
+# Seconds a full public page stays cached; content changes invalidate it sooner.
+PAGE_CACHE_TIMEOUT = int(os.getenv("PAGE_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# Part of every public page ETag; set it per deploy so template changes
+# are not answered with 304 Not Modified.
+RELEASE_ID = os.getenv("RELEASE_ID", "")
+
+# Cache-Control max-age of the read-only JSON API (/api/v1/); clients and
+# CDNs revalidate with the ETag afterwards.
+API_CACHE_MAX_AGE = int(os.getenv("API_CACHE_MAX_AGE", 60))
+
+# Serve home, pillars, projects and gallery with their async variants, which
+# run independent queries concurrently. Only worth it under an ASGI server
+# (e.g. uvicorn beccsite.asgi:application).
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", "False") == "True"
 
 
 # Password validation
@@ -134,13 +179,36 @@ USE_TZ = True
 
 STATIC_URL = "/static/"
 # The directory where collectstatic will gather all static files for production
-# STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATIC_ROOT = os.environ.get('STATIC_ROOT')
+STATIC_ROOT = os.getenv('STATIC_ROOT', BASE_DIR / 'staticfiles')
 # Additional locations of static files (Django will look here too)
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'core/static')
 ]
 
+# In production collectstatic stores content-hashed copies (site.3f2a9c.css)
+# plus .gz/.br siblings; {% static %} then needs the manifest it writes, so
+# build the CSS bundle and vendored JS and run collectstatic before starting:
+# `npm install && npm run build && python manage.py collectstatic`.
+# Development and tests (DEBUG on) use plain names straight from the app dirs.
+STATIC_MANIFEST = os.getenv("STATIC_MANIFEST", str(not DEBUG)) == "True"
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "core.storage.CompressedManifestStaticFilesStorage" if STATIC_MANIFEST
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        ),
+    },
+}
+
+# Serve STATIC_ROOT and MEDIA_ROOT from Django when DEBUG is off (core/serving.py),
+# for deployments without a separate file server.
+SERVE_FILES = os.getenv("SERVE_FILES", "False") == "True"
+# Behind nginx, answer file requests with an X-Accel-Redirect to
+# <prefix>static/<path> or <prefix>media/<path>, e.g. "/_protected/", mapped
+# to the two roots by an internal location.
+FILES_ACCEL_REDIRECT_PREFIX = os.getenv("FILES_ACCEL_REDIRECT_PREFIX", "")
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -179,6 +247,16 @@ JAZZMIN_UI_TWEAKS = {
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Uploaded originals are re-encoded at this quality with their longest edge
+# capped at this many pixels (core/images.py).
+IMAGE_MAX_DIMENSION = int(os.getenv("IMAGE_MAX_DIMENSION", 2560))
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", 82))
+# Seconds a replaced original is kept after normalization before
+# purge_replaced_images deletes it; longer than PAGE_CACHE_TIMEOUT so no
+# cached page still links to it.
+IMAGE_REPLACED_GRACE = int(os.getenv("IMAGE_REPLACED_GRACE", PAGE_CACHE_TIMEOUT + 60 * 60))
+# Bulk gallery uploads send a whole field day's photos in one request.
+DATA_UPLOAD_MAX_NUMBER_FILES = 500
 # Email configuration
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND")
 EMAIL_HOST = os.getenv("EMAIL_HOST")
@@ -187,6 +265,9 @@ EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS") == "True"
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
+# Who is notified of contact form submissions (comma separated); defaults to
+# the organization's contact email. Delivered by `manage.py send_outbox`.
+CONTACT_NOTIFICATION_EMAILS = [e for e in os.getenv("CONTACT_NOTIFICATION_EMAILS", "").split(",") if e]
 
 # authentication settings
 LOGIN_URL = 'login'
@@ -10,7 +10,9 @@ from .models import (
     BlogPost,
     VolunteerApplication,
     Donation,
-    HeroImage
+    HeroImage,
+    ContactMessage,
+    OutboxEmail,
 )
 
 # Optional: Inline for project media
@@ -83,3 +85,19 @@ class DonationAdmin(admin.ModelAdmin):
 class OrganizationAdmin(admin.ModelAdmin):
     list_display = ('name', 'contact_email', 'phone')
     inlines = [HeroImageInline]
+
+
+@admin.register(ContactMessage)
+class ContactMessageAdmin(admin.ModelAdmin):
+    list_display = ('name', 'email', 'subject', 'created_at')
+    search_fields = ('name', 'email', 'subject', 'message')
+    ordering = ('-created_at',)
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('subject',)
+    readonly_fields = ('attempts', 'last_error', 'sent_at', 'created_at')
+    ordering = ('-created_at',)
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+from .models import Donation, DonationRollup
+
+# Buckets shown per period, ending with the current one.
+WINDOWS = {"day": 30, "week": 12, "month": 12}
+
+# Bar colours per donation method (listed in core/assets/css/site.css @source).
+METHOD_COLORS = {"mpesa": "bg-green-600", "paypal": "bg-blue-500", "bank": "bg-yellow-500"}
+DEFAULT_COLOR = "bg-gray-400"
+
+
+def bucket_starts(period, count, today=None):
+    """The first day of the last ``count`` buckets of ``period``, oldest first."""
+    today = today or timezone.localdate()
+    if period == "day":
+        return [today - timedelta(days=n) for n in reversed(range(count))]
+    if period == "week":
+        monday = today - timedelta(days=today.weekday())
+        return [monday - timedelta(weeks=n) for n in reversed(range(count))]
+    starts, month = [], today.replace(day=1)
+    for _ in range(count):
+        starts.append(month)
+        month = (month - timedelta(days=1)).replace(day=1)
+    return starts[::-1]
+
+
+def donation_series(period):
+    """
+    Donation totals per bucket and method for the current ``period`` window,
+    read from DonationRollup. Empty buckets are filled with zeros.
+    """
+    methods = list(Donation._meta.get_field("method").choices)
+    starts = bucket_starts(period, WINDOWS[period])
+    totals = {start: {key: Decimal(0) for key, _ in methods} for start in starts}
+    counts = {start: 0 for start in starts}
+
+    rows = DonationRollup.objects.filter(period=period, bucket__gte=starts[0]).values_list(
+        "bucket", "method", "donations_count", "donations_total",
+    )
+    for bucket, method, count, total in rows:
+        if bucket in totals:
+            totals[bucket][method] = totals[bucket].get(method, Decimal(0)) + total
+            counts[bucket] += count
+
+    return {
+        "period": period,
+        "methods": methods,
+        "buckets": [
+            {"bucket": start, "count": counts[start], "total": sum(totals[start].values()), "methods": totals[start]}
+            for start in starts
+        ],
+    }
+
+
+def chart_bars(series):
+    """Adds stacked-bar segments (height as % of the largest bucket) for the dashboard chart."""
+    peak = max((bucket["total"] for bucket in series["buckets"]), default=0) or 1
+    labels = dict(series["methods"])
+    return [
+        {
+            **bucket,
+            "segments": [
+                {
+                    "label": labels.get(method, method),
+                    "total": total,
+                    "height": float(total / peak * 100),
+                    "color": METHOD_COLORS.get(method, DEFAULT_COLOR),
+                }
+                for method, total in bucket["methods"].items()
+                if total > 0
+            ],
+        }
+        for bucket in series["buckets"]
+    ]
+
+
+def chart_legend(series):
+    """(label, colour class) per donation method."""
+    return [(label, METHOD_COLORS.get(key, DEFAULT_COLOR)) for key, label in series["methods"]]
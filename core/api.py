@@ -0,0 +1,187 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
+
+from .models import Event, Gallery, Partner, Pillar, Project
+from .pagination import keyset_page, querystring
+
+API_VERSION = "v1"
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+# Per resource:
+#   fields: public name -> ORM lookup passed to .values(); "__" lookups join
+#           the related table in the same query
+#   default: fields returned when ?fields= is not given
+#   images: public fields holding storage names, returned as URLs
+#   filters: query parameter -> (ORM lookup, converter)
+#   order: keyset pagination column (newest first, then id)
+RESOURCES = {
+    "projects": {
+        "model": Project,
+        "fields": {
+            "id": "id", "title": "title", "short_description": "short_description",
+            "description": "description", "status": "status", "start_date": "start_date",
+            "end_date": "end_date", "location": "location", "image": "image", "impact": "impact",
+            "pillar_id": "pillar_id", "pillar_title": "pillar__title", "updated_at": "updated_at",
+        },
+        "default": ["id", "title", "short_description", "status", "start_date", "image", "pillar_id", "pillar_title"],
+        "images": ["image"],
+        "filters": {"status": ("status", str), "pillar": ("pillar_id", int)},
+        "order": "start_date",
+    },
+    "pillars": {
+        "model": Pillar,
+        "fields": {
+            "id": "id", "title": "title", "short_description": "short_description",
+            "description": "description", "icon": "icon", "image": "image",
+            "activities": "activities", "updated_at": "updated_at",
+        },
+        "default": ["id", "title", "short_description", "icon", "image"],
+        "images": ["image"],
+        "filters": {},
+        "order": "id",
+    },
+    "events": {
+        "model": Event,
+        "fields": {
+            "id": "id", "title": "title", "description": "description", "date": "date",
+            "location": "location", "organizer": "organizer", "registration_link": "registration_link",
+            "image": "image", "is_upcoming": "is_upcoming", "updated_at": "updated_at",
+        },
+        "default": ["id", "title", "date", "location", "image", "is_upcoming"],
+        "images": ["image"],
+        "filters": {"upcoming": ("is_upcoming", lambda value: value == "1")},
+        "order": "date",
+    },
+    "partners": {
+        "model": Partner,
+        "fields": {
+            "id": "id", "name": "name", "partner_type": "partner_type", "description": "description",
+            "logo": "logo", "website": "website", "updated_at": "updated_at",
+        },
+        "default": ["id", "name", "partner_type", "logo", "website"],
+        "images": ["logo"],
+        "filters": {"type": ("partner_type", str)},
+        "order": "id",
+    },
+    "gallery": {
+        "model": Gallery,
+        "fields": {
+            "id": "id", "title": "title", "description": "description", "image": "image",
+            "project_id": "related_project_id", "pillar_id": "related_pillar_id",
+            "event_id": "related_event_id", "uploaded_at": "uploaded_at",
+        },
+        "default": ["id", "title", "image", "project_id", "pillar_id", "uploaded_at"],
+        "images": ["image"],
+        "filters": {"project": ("related_project_id", int), "pillar": ("related_pillar_id", int)},
+        "order": "uploaded_at",
+    },
+}
+
+
+class APIError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _error(message, status):
+    return _finish(JsonResponse({"error": message}, status=status))
+
+
+def _finish(response):
+    # Revalidated with the ETag added by conditional_page, so a CDN or app
+    # can reuse a response until the content changes.
+    patch_cache_control(response, public=True, max_age=settings.API_CACHE_MAX_AGE)
+    return response
+
+
+def _selected_fields(request, spec):
+    requested = request.GET.get("fields")
+    if not requested:
+        return spec["default"]
+    names = [name.strip() for name in requested.split(",") if name.strip()]
+    unknown = [name for name in names if name not in spec["fields"]]
+    if unknown:
+        raise APIError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(spec['fields'])}.")
+    return ["id", *(name for name in names if name != "id")]
+
+
+def _filtered(request, spec):
+    queryset = spec["model"].objects.all()
+    for param, (lookup, convert) in spec["filters"].items():
+        value = request.GET.get(param)
+        if value is None:
+            continue
+        try:
+            queryset = queryset.filter(**{lookup: convert(value)})
+        except ValueError:
+            raise APIError(f"Invalid value for {param}.")
+    return queryset
+
+
+def _serialize(row, names, spec):
+    item = {name: row[spec["fields"][name]] for name in names}
+    for name in spec["images"]:
+        if name in item:
+            item[name] = default_storage.url(item[name]) if item[name] else None
+    return item
+
+
+def _lookups(names, spec, *extra):
+    return list(dict.fromkeys([*(spec["fields"][name] for name in names), *extra]))
+
+
+def list_response(request, resource):
+    """
+    One page of ``resource`` as {"data": [...], "next": url or null}.
+
+    ?fields= picks the returned fields, ?limit= the page size (at most
+    MAX_LIMIT), ?cursor= continues from a previous page. Rows are fetched
+    with .values() for just the needed columns, and keyset pagination means
+    only one page is ever read from the database.
+    """
+    spec = RESOURCES.get(resource)
+    if spec is None:
+        return _error("Unknown resource.", 404)
+    try:
+        names = _selected_fields(request, spec)
+        queryset = _filtered(request, spec)
+    except APIError as error:
+        return _error(str(error), error.status)
+    try:
+        limit = min(max(int(request.GET.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError:
+        return _error("Invalid limit.", 400)
+
+    order = spec["order"]
+    rows, next_cursor = keyset_page(
+        queryset.values(*_lookups(names, spec, order)),
+        cursor=request.GET.get("cursor"),
+        page_size=limit,
+        field=order,
+    )
+    next_url = None
+    if next_cursor:
+        next_url = request.build_absolute_uri(request.path + querystring(request.GET, cursor=next_cursor))
+    return _finish(JsonResponse({
+        "data": [_serialize(row, names, spec) for row in rows],
+        "next": next_url,
+    }))
+
+
+def detail_response(request, resource, pk):
+    """A single ``resource`` row, with the same ?fields= selection as the list."""
+    spec = RESOURCES.get(resource)
+    if spec is None:
+        return _error("Unknown resource.", 404)
+    try:
+        names = _selected_fields(request, spec)
+    except APIError as error:
+        return _error(str(error), error.status)
+    row = spec["model"].objects.filter(pk=pk).values(*_lookups(names, spec)).first()
+    if row is None:
+        return _error("Not found.", 404)
+    return _finish(JsonResponse({"data": _serialize(row, names, spec)}))
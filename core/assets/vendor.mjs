@@ -0,0 +1,24 @@
+// Copies the pinned front-end dependencies from node_modules into
+// core/static/vendor so they are served (and fingerprinted) by Django
+// instead of a CDN. Run with `npm run build:vendor`.
+import { cpSync, mkdirSync, rmSync } from "node:fs";
+import { dirname, join } from "node:path";
+import { fileURLToPath } from "node:url";
+
+const root = join(dirname(fileURLToPath(import.meta.url)), "..", "..");
+const target = join(root, "core", "static", "vendor");
+
+const files = {
+  "alpinejs/dist/cdn.min.js": "alpine.min.js",
+  "lucide/dist/umd/lucide.min.js": "lucide.min.js",
+  "@fortawesome/fontawesome-free/css/all.min.css": "fontawesome/css/all.min.css",
+  "@fortawesome/fontawesome-free/webfonts": "fontawesome/webfonts",
+};
+
+rmSync(target, { recursive: true, force: true });
+for (const [source, destination] of Object.entries(files)) {
+  const to = join(target, destination);
+  mkdirSync(dirname(to), { recursive: true });
+  cpSync(join(root, "node_modules", source), to, { recursive: true });
+}
+console.log(`Vendored ${Object.keys(files).length} assets into ${target}`);
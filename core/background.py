@@ -0,0 +1,32 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "BACKGROUND_WORKERS", 2),
+    thread_name_prefix="core-background",
+)
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", getattr(func, "__name__", func))
+    finally:
+        # Worker threads get their own DB connections; don't leak them.
+        close_old_connections()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Runs ``func`` on a small in-process thread pool so slow work (image
+    processing) stays off the request thread. Tasks are best-effort: they
+    are lost if the process exits, so anything they produce must also be
+    rebuildable by a management command.
+    """
+    return _executor.submit(_run, func, args, kwargs)
@@ -0,0 +1,256 @@
+import asyncio
+import random
+import re
+import statistics
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection, connections
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .gather import close_connections
+from .metrics import percentile
+from .models import (
+    Donation,
+    DonationRollup,
+    Event,
+    Gallery,
+    OrganizationInfo,
+    Partner,
+    Pillar,
+    Project,
+    SiteStatistics,
+    VolunteerApplication,
+)
+
+DATASETS = {
+    "small": {"pillars": 10, "projects": 10, "gallery": 10_000},
+    "medium": {"pillars": 100, "projects": 100, "gallery": 100_000},
+    "large": {"pillars": 1000, "projects": 1000, "gallery": 1_000_000},
+}
+
+PUBLIC_URLS = ["home", "projects", "pillars", "gallery"]
+DASHBOARD_URLS = ["dashboard", "project_list", "pillar_list", "event_list", "partner_list", "gallery_list"]
+
+BATCH_SIZE = 5000
+
+BENCHMARK_USER = "benchmark"
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def seed(pillars, projects, gallery, seed_value=0):
+    """Fills the (empty) database with a reproducible dataset."""
+    rng = random.Random(seed_value)
+
+    OrganizationInfo.objects.create(
+        name="Benchmark Organization", vision="Vision", mission="Mission", goal="Goal",
+        motto="Motto", slogan="Slogan", about="About", contact_email="info@example.com",
+        phone="0700000000", address="Nairobi",
+    )
+
+    pillar_rows = Pillar.objects.bulk_create(
+        Pillar(
+            title=f"Pillar {i}",
+            description="Pillar description. " * 20,
+            short_description="Short pillar description.",
+            activities=[f"Activity {n}" for n in range(5)],
+        )
+        for i in range(pillars)
+    )
+
+    statuses = [choice for choice, _ in Project.STATUS_CHOICES]
+    project_rows = Project.objects.bulk_create(
+        Project(
+            title=f"Project {i}",
+            pillar=rng.choice(pillar_rows),
+            short_description="Short project summary.",
+            description="Project description. " * 50,
+            start_date=date(2020, 1, 1) + timedelta(days=i),
+            location="Kenya",
+            status=rng.choice(statuses),
+            impact=[f"Impact point {n}" for n in range(4)],
+        )
+        for i in range(projects)
+    )
+
+    event_rows = Event.objects.bulk_create(
+        Event(
+            title=f"Event {i}", description="Event description.", location="Nairobi",
+            date=date(2024, 1, 1) + timedelta(days=i), is_upcoming=i % 2 == 0,
+        )
+        for i in range(max(10, pillars))
+    )
+    Partner.objects.bulk_create(
+        Partner(name=f"Partner {i}", partner_type="ngo", website="https://example.com")
+        for i in range(20)
+    )
+    VolunteerApplication.objects.bulk_create(
+        VolunteerApplication(name=f"Volunteer {i}", email="v@example.com", phone="0700000000", message="Hi")
+        for i in range(100)
+    )
+    Donation.objects.bulk_create(
+        Donation(donor_name=f"Donor {i}", amount=rng.randint(100, 10_000), method="mpesa")
+        for i in range(1000)
+    )
+
+    def gallery_rows():
+        for i in range(gallery):
+            yield Gallery(
+                title=f"Photo {i}",
+                description="Photo description.",
+                image=f"media/gallery/benchmark-{i}.jpg",
+                related_pillar=rng.choice(pillar_rows) if i % 2 == 0 else None,
+                related_project=rng.choice(project_rows) if i % 3 == 0 else None,
+                related_event=rng.choice(event_rows) if i % 10 == 0 else None,
+            )
+
+    for batch in _batched(gallery_rows(), BATCH_SIZE):
+        Gallery.objects.bulk_create(batch)
+
+    SiteStatistics.rebuild()
+    DonationRollup.rebuild()
+    User.objects.create_user(BENCHMARK_USER, password=BENCHMARK_USER, is_staff=True)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def _summary(timings, queries, size, status):
+    timings.sort()
+    return {
+        "status": status,
+        "queries": max(queries),
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+        "mean_ms": round(statistics.fmean(timings), 2),
+        "bytes": size,
+    }
+
+
+def _measure(client, url, repeat, cold):
+    timings, queries, size, status = [], [], 0, None
+    for _ in range(repeat):
+        if cold:
+            cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = client.get(url)
+            content = b"".join(response.streaming_content) if response.streaming else response.content
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(len(captured))
+        size = len(content)
+        status = response.status_code
+    return _summary(timings, queries, size, status)
+
+
+def _server_timing_queries(response):
+    # Async views query from worker threads, which CaptureQueriesContext on
+    # this thread's connection cannot see; the metrics middleware counts them.
+    match = re.search(r'desc="(\d+) queries"', response.get("Server-Timing", ""))
+    return int(match.group(1)) if match else 0
+
+
+async def _ameasure(client, url, repeat, cold):
+    timings, queries, size, status = [], [], 0, None
+    for _ in range(repeat):
+        if cold:
+            await cache.aclear()
+        start = time.perf_counter()
+        response = await client.get(url)
+        content = b"".join([chunk async for chunk in response.streaming_content]) if response.streaming else response.content
+        timings.append((time.perf_counter() - start) * 1000)
+        queries.append(_server_timing_queries(response))
+        size = len(content)
+        status = response.status_code
+    return _summary(timings, queries, size, status)
+
+
+async def _arun(client, repeat, url_names):
+    results = {}
+    try:
+        for name in url_names:
+            url = reverse(name)
+            await client.get(url)  # warm up imports, template loaders and connections
+            results[name] = {
+                "url": url,
+                "cold": await _ameasure(client, url, repeat, cold=True),
+                "warm": await _ameasure(client, url, repeat, cold=False),
+            }
+    finally:
+        # Sync parts of the ASGI requests ran on the thread-sensitive
+        # executor and the async views' queries on gather_queries' workers.
+        # Neither sees request_finished on its own thread, so their
+        # connections stay open; close them so the benchmark database can
+        # be dropped.
+        await sync_to_async(connections.close_all)()
+        await sync_to_async(close_connections, thread_sensitive=False)()
+    return results
+
+
+def run(repeat=20, url_names=None, asgi=False):
+    """
+    Requests each benchmarked URL ``repeat`` times, cold (cache cleared
+    before every request) and warm, and returns {url_name: {"cold", "warm"}}.
+    With ``asgi`` the requests go through Django's ASGI handler.
+    """
+    client = AsyncClient() if asgi else Client()
+    client.login(username=BENCHMARK_USER, password=BENCHMARK_USER)
+    url_names = url_names or PUBLIC_URLS + DASHBOARD_URLS
+
+    if asgi:
+        return asyncio.run(_arun(client, repeat, url_names))
+
+    results = {}
+    for name in url_names:
+        url = reverse(name)
+        client.get(url)  # warm up imports, template loaders and connections
+        results[name] = {
+            "url": url,
+            "cold": _measure(client, url, repeat, cold=True),
+            "warm": _measure(client, url, repeat, cold=False),
+        }
+    return results
+
+
+def compare(results, baseline):
+    """
+    Cold p50/p95 of ``results`` against an earlier run's results, as
+    {url_name: {"p50_ms": (before, after, change %), "p95_ms": ...}}.
+    """
+    comparison = {}
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        comparison[name] = {}
+        for metric in ("p50_ms", "p95_ms"):
+            before, after = baseline[name]["cold"][metric], result["cold"][metric]
+            change = round((after - before) / before * 100, 1) if before else 0.0
+            comparison[name][metric] = (before, after, change)
+    return comparison
+
+
+def check_budgets(results, budgets):
+    """
+    Compares cold-run results with ``budgets``:
+        {"home": {"queries": 6, "p95_ms": 150, "bytes": 200000}, "*": {...}}
+    "*" applies to every URL; per-URL entries override it. Returns a list of
+    human-readable violations.
+    """
+    violations = []
+    for name, result in results.items():
+        budget = {**budgets.get("*", {}), **budgets.get(name, {})}
+        for metric, limit in budget.items():
+            actual = result["cold"].get(metric)
+            if actual is not None and actual > limit:
+                violations.append(f"{name}: {metric} {actual} exceeds budget {limit}")
+    return violations
@@ -0,0 +1,48 @@
+import math
+import re
+from html import unescape
+
+import markdown
+import nh3
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# Average adult silent reading speed, words per minute.
+WORDS_PER_MINUTE = 200
+EXCERPT_WORDS = 40
+
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists"]
+
+# Markup authors may use; everything else (scripts, styles, event handlers,
+# iframes) is stripped when the post is saved.
+ALLOWED_TAGS = {
+    "a", "abbr", "b", "blockquote", "br", "code", "dd", "del", "dl", "dt", "em", "figcaption",
+    "figure", "h2", "h3", "h4", "h5", "h6", "hr", "i", "img", "li", "ol", "p", "pre", "strong",
+    "sub", "sup", "table", "tbody", "td", "th", "thead", "tr", "ul",
+}
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title"},
+    "abbr": {"title"},
+    "img": {"src", "alt", "title", "width", "height"},
+    "td": {"align"},
+    "th": {"align"},
+}
+
+_WORD = re.compile(r"\w+")
+
+
+def render_content(content):
+    """
+    Renders BlogPost.content (Markdown, inline HTML allowed) to sanitized
+    HTML and returns (html, excerpt, reading_time_minutes).
+    """
+    html = nh3.clean(
+        markdown.markdown(content, extensions=MARKDOWN_EXTENSIONS, output_format="html"),
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        link_rel="noopener noreferrer nofollow",
+    )
+    text = unescape(strip_tags(html))
+    words = len(_WORD.findall(text))
+    excerpt = Truncator(" ".join(text.split())).words(EXCERPT_WORDS)
+    return html, excerpt, max(1, math.ceil(words / WORDS_PER_MINUTE))
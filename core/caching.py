@@ -0,0 +1,209 @@
+import asyncio
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .models import HeroImage, OrganizationInfo
+
+CONTENT_VERSION_KEY = "core:content_version"
+PAGE_CACHE_PREFIX = "core:page"
+LAST_MODIFIED_PREFIX = "core:last_modified"
+MODEL_VERSION_PREFIX = "core:model_version"
+FRAGMENT_CACHE_PREFIX = "core:fragment"
+
+
+def get_content_version():
+    """
+    Global content version, bumped whenever any core model changes. Cached
+    pages are keyed on it, so a bump orphans every cached page at once.
+    """
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        # add() so concurrent first requests agree on one version
+        if not cache.add(CONTENT_VERSION_KEY, version, None):
+            version = cache.get(CONTENT_VERSION_KEY, version)
+    return version
+
+
+def bump_content_version():
+    # A timestamp rather than incr() so a cleared cache never reuses an old version.
+    cache.set(CONTENT_VERSION_KEY, time.time_ns(), None)
+
+
+def _model_version_key(model):
+    name = model if isinstance(model, str) else model._meta.model_name
+    return f"{MODEL_VERSION_PREFIX}:{name}"
+
+
+def get_model_versions(*models):
+    """
+    Current version of each model (a class or its model_name, e.g.
+    "partner"), bumped whenever a row of that model changes. Cached template
+    fragments are keyed on the versions of the models they show.
+    """
+    keys = [_model_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = time.time_ns()
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+            versions[key] = version
+    return [versions[key] for key in keys]
+
+
+def bump_model_versions(*models):
+    version = time.time_ns()
+    cache.set_many({_model_version_key(model): version for model in models}, None)
+
+
+def fragment_cache_key(name, models):
+    versions = "-".join(str(version) for version in get_model_versions(*models))
+    # RELEASE_ID keeps a shared cache from serving fragments of old templates.
+    return f"{FRAGMENT_CACHE_PREFIX}:{settings.RELEASE_ID}:{name}:{versions}"
+
+
+def page_cache_key(request):
+    url = request.build_absolute_uri()
+    digest = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+    return f"{PAGE_CACHE_PREFIX}:{get_content_version()}:{digest}"
+
+
+def _is_cacheable(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        # A page that rendered a CSRF token is specific to this visitor.
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+    )
+
+
+def cache_public_page(view_func):
+    """
+    Caches the full response of a public GET view, keyed by host, path,
+    query string and the global content version. Adds an X-Cache header
+    (HIT, MISS or BYPASS). Works for both sync and async views.
+    """
+    if asyncio.iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def async_wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                response = await view_func(request, *args, **kwargs)
+                response["X-Cache"] = "BYPASS"
+                return response
+
+            key = await sync_to_async(page_cache_key)(request)
+            response = await cache.aget(key)
+            if response is not None:
+                response["X-Cache"] = "HIT"
+                return response
+
+            response = await view_func(request, *args, **kwargs)
+            cacheable = _is_cacheable(request, response)
+            if cacheable:
+                await cache.aset(key, response, settings.PAGE_CACHE_TIMEOUT)
+            response["X-Cache"] = "MISS" if cacheable else "BYPASS"
+            return response
+
+        return async_wrapper
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            response = view_func(request, *args, **kwargs)
+            response["X-Cache"] = "BYPASS"
+            return response
+
+        key = page_cache_key(request)
+        response = cache.get(key)
+        if response is not None:
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = view_func(request, *args, **kwargs)
+        cacheable = _is_cacheable(request, response)
+        if cacheable:
+            cache.set(key, response, settings.PAGE_CACHE_TIMEOUT)
+        response["X-Cache"] = "MISS" if cacheable else "BYPASS"
+        return response
+
+    return wrapper
+
+
+def last_modified_of(models):
+    """
+    Latest updated_at across ``models``. Each MAX() is an index lookup, and
+    the result is cached per content version, so it is computed at most
+    once per content change.
+    """
+    labels = ",".join(sorted(model._meta.label_lower for model in models))
+    key = f"{LAST_MODIFIED_PREFIX}:{get_content_version()}:{labels}"
+    latest = cache.get(key)
+    if latest is None:
+        timestamps = [
+            model.objects.aggregate(latest=Max("updated_at"))["latest"]
+            for model in models
+        ]
+        latest = max((ts for ts in timestamps if ts), default=None)
+        cache.set(key, latest or 0, settings.PAGE_CACHE_TIMEOUT)
+    return latest or None
+
+
+def conditional_public_page(*models):
+    """
+    Adds ETag / Last-Modified validators to a public view so repeat visitors
+    get a 304. Last-Modified is the newest updated_at among ``models`` (plus
+    the organization info shown on every page). The ETag is the content
+    version, which also changes on deletes, which updated_at cannot see.
+    Works for both sync and async views.
+    """
+    page_models = {*models, OrganizationInfo, HeroImage}
+
+    def validators(request):
+        if request.method not in ("GET", "HEAD"):
+            return None, None, None
+        etag = quote_etag("-".join(filter(None, [settings.RELEASE_ID, str(get_content_version())])))
+        latest = last_modified_of(page_models)
+        timestamp = int(latest.timestamp()) if latest else None
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        return etag, timestamp, not_modified
+
+    def finish(response, etag, timestamp):
+        if etag and not response.has_header("ETag"):
+            response.headers["ETag"] = etag
+        if timestamp and not response.has_header("Last-Modified"):
+            response.headers["Last-Modified"] = http_date(timestamp)
+        # Let browsers keep the page but revalidate it on every visit.
+        patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+        return response
+
+    def decorator(view_func):
+        if asyncio.iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                etag, timestamp, response = await sync_to_async(validators)(request)
+                if response is None:
+                    response = await view_func(request, *args, **kwargs)
+                return finish(response, etag, timestamp)
+
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            etag, timestamp, response = validators(request)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+            return finish(response, etag, timestamp)
+
+        return wrapper
+
+    return decorator
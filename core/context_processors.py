@@ -1,9 +1,36 @@
-from .models import OrganizationInfo
+from django.conf import settings
+from django.core.cache import cache
+
+from .caching import get_model_versions
+from .models import HeroImage, OrganizationInfo
+
+ORGANIZATION_CACHE_KEY = "core:organization_info"
+
+
+def get_organization_snapshot():
+    """
+    Returns (org_info, hero_images) from the cache, loading it on a miss.
+    The key includes the OrganizationInfo and HeroImage model versions, so
+    a change made by any process (with a shared cache backend) is picked up
+    on the next request.
+    """
+    versions = "-".join(str(version) for version in get_model_versions(OrganizationInfo, HeroImage))
+    key = f"{ORGANIZATION_CACHE_KEY}:{versions}"
+    snapshot = cache.get(key)
+    if snapshot is None:
+        org_info = OrganizationInfo.objects.first()
+        hero_images = list(org_info.hero_images.all()) if org_info else []
+        snapshot = (org_info, hero_images)
+        cache.set(key, snapshot, settings.PAGE_CACHE_TIMEOUT)
+    return snapshot
+
 
 def organization_info(request):
     """
     Makes organization info available in all templates.
     """
+    org_info, hero_images = get_organization_snapshot()
     return {
-        'org_info': OrganizationInfo.objects.first()
+        'org_info': org_info,
+        'hero_images': hero_images,
     }
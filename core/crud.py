@@ -0,0 +1,123 @@
+from django.http import QueryDict
+
+from .pagination import querystring
+
+LIST_PAGE_SIZE = 25
+
+
+def _resolve(obj, path):
+    """Follows a Django-style lookup path (``related_event__title``) on an instance."""
+    value = obj
+    for part in path.split("__"):
+        value = getattr(value, part, None)
+        if value is None:
+            return ""
+    return value
+
+
+def _field_choices(model, path):
+    """
+    {value: label} of the model field at the end of ``path`` when it has
+    choices (what get_FOO_display() shows), otherwise None.
+    """
+    for part in path.split("__")[:-1]:
+        model = model._meta.get_field(part).related_model
+    field = model._meta.get_field(path.split("__")[-1])
+    return dict(field.flatchoices) if field.flatchoices else None
+
+
+def _cell(obj, path, choices):
+    value = _resolve(obj, path)
+    if choices is not None:
+        return choices.get(value, value)
+    return value
+
+
+def build_list_context(request, queryset, columns, filters=(), default_sort="-id", page_size=LIST_PAGE_SIZE):
+    """
+    Builds the table part of the context for core/crud_list_base.html.
+
+    ``columns`` is a list of dicts:
+        {"header": "Project", "field": "related_project__title", "sortable": True}
+    Fields may span relations with ``__``; the relations are joined with
+    select_related() and only the listed columns are loaded with only().
+    Fields with choices are shown with their labels.
+
+    ``filters`` is a list of exact-match filters shown above the table:
+        {"param": "type", "field": "partner_type", "label": "Type", "choices": [("ngo", "NGO"), ...]}
+
+    Sorting (``?sort=title`` / ``?sort=-title``) is limited to sortable
+    columns, and pages are fetched with LIMIT/OFFSET without a COUNT query.
+    """
+    params = request.GET.copy()
+
+    related = {
+        "__".join(column["field"].split("__")[:-1])
+        for column in columns
+        if "__" in column["field"]
+    }
+    if related:
+        queryset = queryset.select_related(*related)
+    queryset = queryset.only("id", *(column["field"] for column in columns))
+
+    # Filters
+    active_filters = []
+    for spec in filters:
+        value = params.get(spec["param"], "")
+        allowed = {str(choice) for choice, _ in spec["choices"]}
+        if value in allowed:
+            queryset = queryset.filter(**{spec["field"]: value})
+        else:
+            value = ""
+        active_filters.append({**spec, "value": value})
+
+    # Sorting
+    sortable = {column["field"] for column in columns if column.get("sortable")}
+    sort = params.get("sort", default_sort)
+    if sort.lstrip("-") not in sortable:
+        sort = default_sort
+    queryset = queryset.order_by(sort, "-id" if sort.startswith("-") else "id")
+
+    headers = []
+    for column in columns:
+        header = {"label": column["header"], "sort_url": None, "direction": None}
+        if column["field"] in sortable:
+            if sort == column["field"]:
+                header["direction"] = "asc"
+                next_sort = f"-{column['field']}"
+            elif sort == f"-{column['field']}":
+                header["direction"] = "desc"
+                next_sort = column["field"]
+            else:
+                next_sort = column["field"]
+            header["sort_url"] = querystring(params, sort=next_sort, page=None)
+        headers.append(header)
+
+    # Pagination: fetch one extra row to know whether a next page exists
+    try:
+        page = max(int(params.get("page", 1)), 1)
+    except ValueError:
+        page = 1
+    offset = (page - 1) * page_size
+    objects = list(queryset[offset:offset + page_size + 1])
+    has_next = len(objects) > page_size
+    objects = objects[:page_size]
+
+    choices = [_field_choices(queryset.model, column["field"]) for column in columns]
+    rows = [
+        {
+            "id": obj.pk,
+            "cells": [_cell(obj, column["field"], column_choices) for column, column_choices in zip(columns, choices)],
+        }
+        for obj in objects
+    ]
+
+    return {
+        "headers": headers,
+        "rows": rows,
+        "filters": active_filters,
+        "page": page,
+        "previous_url": querystring(params, page=page - 1) if page > 1 else None,
+        "next_url": querystring(params, page=page + 1) if has_next else None,
+        "clear_filters_url": querystring(QueryDict(mutable=True)),
+    }
@@ -0,0 +1,138 @@
+import csv
+import io
+from datetime import datetime, time
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Donation, DonationRollup, SiteStatistics
+
+BATCH_SIZE = 10_000
+
+STAGING_TABLE = "donation_import"
+COLUMNS = ["donor_name", "amount", "method", "transaction_id", "date"]
+METHODS = {choice for choice, _ in Donation._meta.get_field("method").choices}
+
+_MAX_LENGTHS = {name: Donation._meta.get_field(name).max_length for name in ("donor_name", "transaction_id")}
+_amount_field = Donation._meta.get_field("amount")
+MAX_AMOUNT = Decimal(10) ** (_amount_field.max_digits - _amount_field.decimal_places)
+
+
+def _parse_timestamp(value):
+    value = value.strip()
+    if not value:
+        return timezone.now()
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid date {value!r}")
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _clean(row, default_method):
+    """Returns the staging row for a CSV record, or raises ValueError."""
+    method = (row.get("method") or default_method or "").strip().lower()
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}")
+    try:
+        amount = Decimal((row.get("amount") or "").replace(",", "").strip())
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount {row.get('amount')!r}")
+    if not amount.is_finite() or abs(amount) >= MAX_AMOUNT:
+        raise ValueError(f"Amount out of range {row.get('amount')!r}")
+    donor_name = (row.get("donor_name") or "").strip()
+    transaction_id = (row.get("transaction_id") or "").strip()
+    if len(donor_name) > _MAX_LENGTHS["donor_name"] or len(transaction_id) > _MAX_LENGTHS["transaction_id"]:
+        raise ValueError("Value too long")
+    return [donor_name, amount, method, transaction_id, _parse_timestamp(row.get("date") or "").isoformat()]
+
+
+def _copy_batch(cursor, rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    # Raw psycopg2 cursor: COPY streams the batch in one round trip.
+    cursor.cursor.copy_expert(
+        f"COPY {STAGING_TABLE} ({', '.join(COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer,
+    )
+
+
+def _merge(cursor):
+    """
+    Moves the staged rows into core_donation, skipping (method,
+    transaction_id) pairs that already exist, and folds the inserted rows
+    into DonationRollup in the same statement. Returns (inserted, total).
+    """
+    donation, rollup = Donation._meta.db_table, DonationRollup._meta.db_table
+    cursor.execute(
+        f"""
+        WITH inserted AS (
+            INSERT INTO {donation} (donor_name, amount, method, transaction_id, date)
+            SELECT donor_name, amount, method, transaction_id, date FROM {STAGING_TABLE}
+            ON CONFLICT (method, transaction_id) WHERE transaction_id <> '' DO NOTHING
+            RETURNING amount, method, date
+        ), rolled_up AS (
+            INSERT INTO {rollup} AS r (period, bucket, method, donations_count, donations_total)
+            SELECT period, date_trunc(period, i.date AT TIME ZONE %s)::date, i.method, COUNT(*), SUM(i.amount)
+            FROM inserted i CROSS JOIN unnest(%s::varchar[]) AS period
+            GROUP BY 1, 2, 3
+            ON CONFLICT (period, bucket, method) DO UPDATE SET
+                donations_count = r.donations_count + EXCLUDED.donations_count,
+                donations_total = r.donations_total + EXCLUDED.donations_total
+        )
+        SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM inserted
+        """,
+        [settings.TIME_ZONE, DonationRollup.PERIODS],
+    )
+    return cursor.fetchone()
+
+
+def import_donations(file, default_method=None, batch_size=BATCH_SIZE):
+    """
+    Loads donation rows from a CSV ``file`` (header row with donor_name,
+    amount, method, transaction_id, date; method may be left out in
+    favour of ``default_method``).
+
+    Rows are streamed into a temporary staging table with COPY in batches
+    of ``batch_size``, then merged into Donation with one INSERT ... ON
+    CONFLICT DO NOTHING on (method, transaction_id). Everything runs in one
+    transaction. Returns counts of rows read, inserted, duplicate and
+    rejected (unparseable), with the first few rejection reasons.
+    """
+    result = {"read": 0, "inserted": 0, "duplicates": 0, "rejected": 0, "errors": []}
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {STAGING_TABLE} ("
+            "donor_name varchar(255), amount numeric(10, 2), method varchar(50), "
+            "transaction_id varchar(100), date timestamptz) ON COMMIT DROP"
+        )
+        batch = []
+        for line, row in enumerate(csv.DictReader(file), start=2):
+            result["read"] += 1
+            try:
+                batch.append(_clean(row, default_method))
+            except ValueError as error:
+                result["rejected"] += 1
+                if len(result["errors"]) < 10:
+                    result["errors"].append(f"line {line}: {error}")
+                continue
+            if len(batch) >= batch_size:
+                _copy_batch(cursor, batch)
+                batch = []
+        if batch:
+            _copy_batch(cursor, batch)
+
+        inserted, total = _merge(cursor)
+        if inserted:
+            SiteStatistics.adjust(donations_count=inserted, donations_total=total)
+
+    result["inserted"] = inserted
+    result["duplicates"] = result["read"] - result["rejected"] - inserted
+    return result
@@ -1,7 +1,13 @@
 from django import forms
-from .models import Project, Pillar, Event, Partner, Gallery, OrganizationInfo, HeroImage
+from .models import Project, Pillar, Event, Partner, Gallery, OrganizationInfo, HeroImage, ContactMessage
 import json
 
+class ContactForm(forms.ModelForm):
+    class Meta:
+        model = ContactMessage
+        fields = ['name', 'email', 'subject', 'message']
+
+
 class GalleryForm(forms.ModelForm):
     class Meta:
         model = Gallery
@@ -15,6 +21,36 @@ class GalleryForm(forms.ModelForm):
         }
 
 
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleFileField(forms.FileField):
+    """File field that accepts several files and cleans to a list."""
+    widget = MultipleFileInput
+
+    def clean(self, data, initial=None):
+        single_file_clean = super().clean
+        if isinstance(data, (list, tuple)):
+            if not data and self.required:
+                raise forms.ValidationError(self.error_messages['required'], code='required')
+            return [single_file_clean(item, initial) for item in data]
+        return [single_file_clean(data, initial)]
+
+
+class GalleryBulkUploadForm(forms.Form):
+    images = MultipleFileField(widget=MultipleFileInput(attrs={'class': 'w-full', 'accept': 'image/*', 'multiple': True}))
+    title = forms.CharField(
+        max_length=180, required=False,
+        help_text='Optional. Photos are titled "<title> 1", "<title> 2", ... or after their file names.',
+        widget=forms.TextInput(attrs={'class': 'w-full p-2 border rounded-lg'}),
+    )
+    description = forms.CharField(required=False, widget=forms.Textarea(attrs={'class': 'w-full p-2 border rounded-lg', 'rows': 2}))
+    related_pillar = forms.ModelChoiceField(queryset=Pillar.objects.all(), required=False, widget=forms.Select(attrs={'class': 'w-full p-2 border rounded-lg'}))
+    related_project = forms.ModelChoiceField(queryset=Project.objects.all(), required=False, widget=forms.Select(attrs={'class': 'w-full p-2 border rounded-lg'}))
+    related_event = forms.ModelChoiceField(queryset=Event.objects.all(), required=False, widget=forms.Select(attrs={'class': 'w-full p-2 border rounded-lg'}))
+
+
 class PartnerForm(forms.ModelForm):
     class Meta:
         model = Partner
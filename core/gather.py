@@ -0,0 +1,54 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+WORKERS = getattr(settings, "GATHER_QUERY_WORKERS", 8)
+
+_executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="core-gather")
+
+
+def _run_query(func):
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        # Each worker thread owns its connection; keep it only while
+        # CONN_MAX_AGE allows, exactly like a request thread would.
+        close_old_connections()
+
+
+async def gather_queries(*funcs):
+    """
+    Runs independent, synchronous ORM fetches concurrently and returns
+    their results in order.
+
+    Django's async ORM methods (aget, acount, async for) all hop onto the
+    one thread-sensitive thread, so gathering them still runs the SQL one
+    query at a time. Each ``func`` here runs on a worker thread with its
+    own database connection instead, so the queries really overlap.
+    ``func`` must return fully evaluated data (lists, not querysets).
+    """
+    return await asyncio.gather(*(
+        sync_to_async(_run_query, thread_sensitive=False, executor=_executor)(func)
+        for func in funcs
+    ))
+
+
+def close_connections():
+    """
+    Closes the database connections kept open by the worker threads, e.g.
+    before dropping the database they point at (manage.py benchmark).
+    """
+    barrier = threading.Barrier(WORKERS)
+
+    def close():
+        connections.close_all()
+        # Hold this thread until every worker has taken one call.
+        barrier.wait(timeout=30)
+
+    for future in [_executor.submit(close) for _ in range(WORKERS)]:
+        future.result()
@@ -0,0 +1,246 @@
+import logging
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, features
+
+from .caching import bump_content_version, bump_model_versions
+from .models import ProcessedImage
+
+# Width buckets for generated renditions, smallest first.
+RENDITION_WIDTHS = (320, 640, 1024, 1600)
+
+# Output formats in order of preference for <picture> sources.
+RENDITION_FORMATS = [
+    fmt for fmt in ("avif", "webp", "jpeg")
+    if fmt == "jpeg" or features.check(fmt)
+]
+
+FORMAT_OPTIONS = {
+    "avif": {"format": "AVIF", "quality": 55},
+    "webp": {"format": "WEBP", "quality": 75, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 80, "optimize": True, "progressive": True},
+}
+
+MIME_TYPES = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+}
+
+RENDITIONS_CACHE_PREFIX = "core:renditions:"
+# Seconds an image without renditions is remembered as such; they may be
+# generated at any moment by the upload task or generate_renditions.
+RENDITIONS_MISS_TIMEOUT = 60
+
+# Encoder options for re-encoding uploaded originals, by format. Other
+# formats (GIF, animations, ...) are stored as uploaded.
+NORMALIZE_OPTIONS = {
+    "JPEG": lambda quality: {"quality": quality, "optimize": True, "progressive": True},
+    "WEBP": lambda quality: {"quality": quality, "method": 4},
+    "PNG": lambda quality: {"optimize": True},
+}
+
+logger = logging.getLogger(__name__)
+
+
+def rendition_name(name, width, fmt):
+    """
+    Storage name of a rendition, kept next to the original:
+    media/gallery/photo.jpg -> media/gallery/renditions/photo-640w.webp
+    """
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    ext = "jpg" if fmt == "jpeg" else fmt
+    return posixpath.join(directory, "renditions", f"{stem}-{width}w.{ext}")
+
+
+def _target_widths(original_width):
+    """
+    Buckets narrower than the original, plus the first bucket at or above it
+    (rendered at the original width; originals are never upscaled).
+    """
+    widths = [w for w in RENDITION_WIDTHS if w < original_width]
+    larger = [w for w in RENDITION_WIDTHS if w >= original_width]
+    if larger:
+        widths.append(larger[0])
+    return widths
+
+
+def _encode(image, fmt):
+    if fmt == "jpeg" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, **FORMAT_OPTIONS[fmt])
+    return buffer.getvalue()
+
+
+def generate_renditions(field_file):
+    """
+    Writes width-bucketed AVIF/WebP/JPEG renditions of an image next to the
+    original and returns the generated widths.
+    """
+    if not field_file:
+        return []
+
+    storage = field_file.storage
+    with storage.open(field_file.name, "rb") as fh:
+        original = Image.open(fh)
+        original = ImageOps.exif_transpose(original)
+        original.load()
+
+    if original.mode not in ("RGB", "RGBA", "L"):
+        has_alpha = original.mode in ("LA", "PA") or "transparency" in original.info
+        original = original.convert("RGBA" if has_alpha else "RGB")
+
+    widths = _target_widths(original.width)
+    for width in widths:
+        if width < original.width:
+            height = max(1, round(original.height * width / original.width))
+            resized = original.resize((width, height), Image.LANCZOS)
+        else:
+            resized = original
+        for fmt in RENDITION_FORMATS:
+            name = rendition_name(field_file.name, width, fmt)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(_encode(resized, fmt)))
+
+    cache.set(RENDITIONS_CACHE_PREFIX + field_file.name, _find_renditions(storage, field_file.name), None)
+    return widths
+
+
+def _find_renditions(storage, name):
+    renditions = {}
+    for fmt in RENDITION_FORMATS:
+        found = []
+        for width in RENDITION_WIDTHS:
+            rendition = rendition_name(name, width, fmt)
+            if storage.exists(rendition):
+                found.append((width, storage.url(rendition)))
+        if found:
+            renditions[fmt] = found
+    return renditions
+
+
+def available_renditions(field_file):
+    """
+    Returns {format: [(width, url), ...]} for the renditions that exist on
+    storage. The lookup is cached per file name, since a new upload always
+    gets a new name; a miss only for RENDITIONS_MISS_TIMEOUT.
+    """
+    if not field_file:
+        return {}
+
+    key = RENDITIONS_CACHE_PREFIX + field_file.name
+    renditions = cache.get(key)
+    if renditions is None:
+        renditions = _find_renditions(field_file.storage, field_file.name)
+        cache.set(key, renditions, None if renditions else RENDITIONS_MISS_TIMEOUT)
+    return renditions
+
+
+def build_renditions_safely(field_file):
+    """Variant of generate_renditions for signal handlers: logs instead of raising."""
+    try:
+        return generate_renditions(field_file)
+    except (OSError, ValueError):
+        logger.exception("Could not build renditions for %s", field_file.name)
+        return []
+
+
+def _has_metadata(image):
+    return bool(image.getexif()) or any(key in image.info for key in ("xmp", "XML:com.adobe.xmp", "comment"))
+
+
+def normalize_image(field_file, max_dimension=None, quality=None):
+    """
+    Re-encodes an uploaded original: applies its EXIF orientation, drops
+    metadata (EXIF/GPS, XMP, comments; the ICC colour profile is kept), caps
+    the longest edge at IMAGE_MAX_DIMENSION and encodes at IMAGE_QUALITY.
+
+    The result is saved under a new name, which is returned along with
+    (original_bytes, stored_bytes, width, height). The name is unchanged
+    when the original is already clean and re-encoding would not shrink it.
+    """
+    max_dimension = max_dimension or settings.IMAGE_MAX_DIMENSION
+    quality = quality or settings.IMAGE_QUALITY
+    storage = field_file.storage
+
+    with storage.open(field_file.name, "rb") as fh:
+        original = fh.read()
+    image = Image.open(BytesIO(original))
+    unchanged = (field_file.name, len(original), len(original), image.width, image.height)
+    if image.format not in NORMALIZE_OPTIONS or getattr(image, "is_animated", False):
+        return unchanged
+
+    fmt = image.format
+    dirty = _has_metadata(image)
+    icc_profile = image.info.get("icc_profile")
+    image = ImageOps.exif_transpose(image)
+    if max(image.size) > max_dimension:
+        image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+        dirty = True
+    if fmt == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    options = NORMALIZE_OPTIONS[fmt](quality)
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+    buffer = BytesIO()
+    image.save(buffer, format=fmt, **options)
+    encoded = buffer.getvalue()
+    if not dirty and len(encoded) >= len(original):
+        return unchanged
+
+    # Saved next to the original rather than over it, so a failed write
+    # never loses the upload.
+    name = storage.save(field_file.name, ContentFile(encoded))
+    return name, len(original), len(encoded), image.width, image.height
+
+
+def process_upload(model, pk, field_name, renditions=True):
+    """
+    Background task for a newly uploaded image: normalizes the original
+    once (recorded in ProcessedImage), builds renditions when ``renditions``
+    is set, then invalidates the cached pages and fragments of ``model``.
+    A replaced original is left on storage for purge_replaced_images.
+    """
+    instance = model.objects.filter(pk=pk).only("pk", field_name).first()
+    field_file = getattr(instance, field_name, None)
+    if not field_file:
+        return
+
+    if not ProcessedImage.objects.filter(name=field_file.name).exists():
+        old_name = field_file.name
+        try:
+            name, original_bytes, stored_bytes, width, height = normalize_image(field_file)
+        except (OSError, ValueError):
+            logger.exception("Could not normalize %s", old_name)
+            return
+        if name != old_name:
+            # Only switch if the row still points at this upload.
+            if not model.objects.filter(pk=pk, **{field_name: old_name}).update(**{field_name: name}):
+                field_file.storage.delete(name)
+                return
+            # The old file stays until purge_replaced_images: cached pages
+            # and other workers may still link to it.
+            field_file.name = name
+        ProcessedImage.objects.get_or_create(name=name, defaults={
+            "replaced_name": old_name if name != old_name else "",
+            "original_bytes": original_bytes,
+            "stored_bytes": stored_bytes,
+            "width": width,
+            "height": height,
+        })
+        logger.info("Normalized %s: %d -> %d bytes", name, original_bytes, stored_bytes)
+
+    if renditions and not available_renditions(field_file):
+        build_renditions_safely(field_file)
+
+    bump_model_versions(model)
+    bump_content_version()
+
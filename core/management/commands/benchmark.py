@@ -0,0 +1,100 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from core import benchmarks
+from core.models import Pillar
+
+DEFAULT_BUDGETS = Path(__file__).resolve().parents[2] / "benchmark_budgets.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the public and dashboard pages against a seeded throwaway "
+        "database: query count, wall time p50/p95 and response bytes. "
+        "Fails when a budget is exceeded."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dataset", choices=sorted(benchmarks.DATASETS), default="small")
+        parser.add_argument("--pillars", type=int, help="Override the dataset's pillar count.")
+        parser.add_argument("--projects", type=int, help="Override the dataset's project count.")
+        parser.add_argument("--gallery", type=int, help="Override the dataset's gallery row count.")
+        parser.add_argument("--repeat", type=int, default=20, help="Requests per URL and mode.")
+        parser.add_argument("--url", action="append", dest="urls", help="Only benchmark this URL name (repeatable).")
+        parser.add_argument("--output", help="Write the results as JSON to this file.")
+        parser.add_argument("--budgets", default=str(DEFAULT_BUDGETS), help="JSON file of per-URL budgets.")
+        parser.add_argument("--keepdb", action="store_true", help="Reuse the benchmark database between runs.")
+        parser.add_argument(
+            "--asgi", action="store_true",
+            help="Send requests through the ASGI handler. Set ASYNC_VIEWS=True to use the async public views.",
+        )
+        parser.add_argument("--baseline", help="Earlier --output file to compare cold latencies against.")
+
+    def handle(self, *args, **options):
+        sizes = dict(benchmarks.DATASETS[options["dataset"]])
+        for key in sizes:
+            if options[key] is not None:
+                sizes[key] = options[key]
+
+        setup_test_environment()
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            if not Pillar.objects.exists():
+                self.stdout.write(f"Seeding {sizes} ...")
+                benchmarks.seed(**sizes)
+            results = benchmarks.run(repeat=options["repeat"], url_names=options["urls"], asgi=options["asgi"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        self.stdout.write(f"Handler: {'ASGI' if options['asgi'] else 'WSGI'}, async views: {settings.ASYNC_VIEWS}")
+        self._print(results)
+
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text())["results"]
+            self._print_comparison(benchmarks.compare(results, baseline))
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps({
+                "dataset": options["dataset"],
+                "sizes": sizes,
+                "repeat": options["repeat"],
+                "asgi": options["asgi"],
+                "async_views": settings.ASYNC_VIEWS,
+                "results": results,
+            }, indent=2))
+            self.stdout.write(f"Results written to {options['output']}")
+
+        budgets_path = Path(options["budgets"])
+        if budgets_path.exists():
+            budgets = json.loads(budgets_path.read_text()).get(options["dataset"], {})
+            violations = benchmarks.check_budgets(results, budgets)
+            if violations:
+                raise CommandError("Budget exceeded:\n  " + "\n  ".join(violations))
+            self.stdout.write(self.style.SUCCESS("All budgets met."))
+
+    def _print(self, results):
+        self.stdout.write(
+            f"{'url':<16}{'queries':>8}{'p50 ms':>10}{'p95 ms':>10}{'warm p50':>10}{'bytes':>10}"
+        )
+        for name, result in results.items():
+            cold, warm = result["cold"], result["warm"]
+            self.stdout.write(
+                f"{name:<16}{cold['queries']:>8}{cold['p50_ms']:>10}{cold['p95_ms']:>10}"
+                f"{warm['p50_ms']:>10}{cold['bytes']:>10}"
+            )
+
+    def _print_comparison(self, comparison):
+        self.stdout.write(f"\n{'url':<16}{'p50 before':>12}{'p50 after':>12}{'change':>9}{'p95 before':>12}{'p95 after':>12}{'change':>9}")
+        for name, metrics in comparison.items():
+            row = f"{name:<16}"
+            for metric in ("p50_ms", "p95_ms"):
+                before, after, change = metrics[metric]
+                row += f"{before:>12}{after:>12}{change:>+8}%"
+            self.stdout.write(row)
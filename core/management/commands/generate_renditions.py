@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from core.caching import bump_content_version, bump_model_versions
+from core.images import available_renditions, generate_renditions
+from core.signals import RESPONSIVE_IMAGE_FIELDS
+
+
+class Command(BaseCommand):
+    help = "Generate responsive image renditions for existing uploads."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild renditions even if they already exist.",
+        )
+
+    def handle(self, *args, **options):
+        built = 0
+        changed = set()
+        for model, field_names in RESPONSIVE_IMAGE_FIELDS.items():
+            for instance in model.objects.only("pk", *field_names).iterator():
+                for field_name in field_names:
+                    field_file = getattr(instance, field_name)
+                    if not field_file:
+                        continue
+                    if not options["force"] and available_renditions(field_file):
+                        continue
+                    try:
+                        widths = generate_renditions(field_file)
+                    except (OSError, ValueError) as exc:
+                        self.stderr.write(f"{field_file.name}: {exc}")
+                        continue
+                    built += 1
+                    changed.add(model)
+                    self.stdout.write(f"{field_file.name}: {', '.join(f'{w}w' for w in widths)}")
+
+        if changed:
+            # Cached pages and fragments still hold the <img> markup without
+            # the new <picture> sources.
+            bump_model_versions(*changed)
+            bump_content_version()
+        self.stdout.write(self.style.SUCCESS(f"Built renditions for {built} image(s)."))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, Sum
+
+from core.caching import bump_content_version
+from core.images import process_upload
+from core.models import ProcessedImage
+from core.signals import RESPONSIVE_IMAGE_FIELDS, UPLOADED_IMAGE_FIELDS
+
+
+class Command(BaseCommand):
+    help = (
+        "Normalize existing uploads that predate ingest normalization: fix "
+        "orientation, strip metadata, cap dimensions and re-encode."
+    )
+
+    def handle(self, *args, **options):
+        processed = set(ProcessedImage.objects.values_list("name", flat=True))
+        for model, field_names in UPLOADED_IMAGE_FIELDS.items():
+            responsive = RESPONSIVE_IMAGE_FIELDS.get(model, [])
+            for instance in model.objects.only("pk", *field_names).iterator():
+                for field_name in field_names:
+                    field_file = getattr(instance, field_name)
+                    if field_file and field_file.name not in processed:
+                        self.stdout.write(field_file.name)
+                        process_upload(model, instance.pk, field_name, field_name in responsive)
+        # Run from a separate process: the bump reaches the web workers
+        # through the shared cache, so no page keeps the old image URLs.
+        bump_content_version()
+
+        totals = ProcessedImage.objects.aggregate(
+            count=Count("id"),
+            before=Sum("original_bytes"),
+            saved=Sum(F("original_bytes") - F("stored_bytes")),
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"{totals['count']} image(s) normalized, {(totals['saved'] or 0) / 1024 / 1024:.1f} MB saved "
+            f"of {(totals['before'] or 0) / 1024 / 1024:.1f} MB."
+        ))
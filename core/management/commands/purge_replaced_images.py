@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import ProcessedImage
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete originals replaced by ingest normalization once they are older "
+        "than IMAGE_REPLACED_GRACE, so cached pages no longer link to them."
+    )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(seconds=settings.IMAGE_REPLACED_GRACE)
+        replaced = ProcessedImage.objects.exclude(replaced_name="").filter(processed_at__lt=cutoff)
+        purged = 0
+        for image in replaced.only("pk", "replaced_name").iterator():
+            default_storage.delete(image.replaced_name)
+            ProcessedImage.objects.filter(pk=image.pk).update(replaced_name="")
+            purged += 1
+        self.stdout.write(self.style.SUCCESS(f"Deleted {purged} replaced original(s)."))
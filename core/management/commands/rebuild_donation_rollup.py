@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.models import DonationRollup
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-day/week/month donation rollup from the donations table."
+
+    def handle(self, *args, **options):
+        rows = DonationRollup.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} donation rollup rows"))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from core.search import rebuild_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored full-text search vectors for all searchable content."
+
+    def handle(self, *args, **options):
+        for kind, count in rebuild_search_vectors().items():
+            self.stdout.write(f"{kind}: {count} row(s)")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.models import SiteStatistics
+
+
+class Command(BaseCommand):
+    help = "Recompute the dashboard rollup counters from the source tables."
+
+    def handle(self, *args, **options):
+        stats = SiteStatistics.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Events: {stats.events_count}, partners: {stats.partners_count}, "
+            f"volunteers: {stats.volunteers_count}, donations: {stats.donations_count} "
+            f"totalling {stats.donations_total}"
+        ))
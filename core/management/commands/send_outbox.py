@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core import outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver queued outbox emails in batches over one SMTP connection. "
+        "Runs once by default; use --loop to keep polling (e.g. under systemd)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=outbox.BATCH_SIZE)
+        parser.add_argument("--max-attempts", type=int, default=outbox.MAX_ATTEMPTS)
+        parser.add_argument("--loop", action="store_true", help="Keep running, polling for due emails.")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when nothing is due.")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, retried, failed = outbox.deliver_batch(options["batch_size"], options["max_attempts"])
+            if sent or retried or failed:
+                self.stdout.write(f"Sent {sent}, retrying {retried}, failed {failed}")
+            if not options["loop"]:
+                break
+            # A full batch means more may be due right away.
+            if sent + retried + failed < options["batch_size"]:
+                time.sleep(options["interval"])
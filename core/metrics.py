@@ -0,0 +1,72 @@
+import heapq
+import threading
+from collections import defaultdict, deque
+
+# Requests kept per URL name for the rolling percentiles.
+WINDOW_SIZE = 1000
+# Slowest queries remembered per URL name.
+SLOW_QUERIES_KEPT = 5
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class MetricsStore:
+    """
+    Process-local rolling window of request timings, grouped by URL name.
+    Each worker process keeps its own window.
+    """
+
+    def __init__(self, window_size=WINDOW_SIZE):
+        self._lock = threading.Lock()
+        self._window_size = window_size
+        self._samples = defaultdict(lambda: deque(maxlen=self._window_size))
+        self._slow_queries = defaultdict(list)
+
+    def record(self, url_name, total_ms, sql_ms, sql_count, template_ms, slow_queries=()):
+        with self._lock:
+            self._samples[url_name].append((total_ms, sql_ms, sql_count, template_ms))
+            heap = self._slow_queries[url_name]
+            for duration, sql in slow_queries:
+                if any(sql == seen for _, seen in heap):
+                    continue
+                if len(heap) < SLOW_QUERIES_KEPT:
+                    heapq.heappush(heap, (duration, sql))
+                elif duration > heap[0][0]:
+                    heapq.heapreplace(heap, (duration, sql))
+
+    def summary(self):
+        """Per URL name: request count, total time p50/p95/p99, SQL and template means."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+            slow = {name: sorted(heap, reverse=True) for name, heap in self._slow_queries.items()}
+
+        rows = []
+        for name, values in samples.items():
+            totals = sorted(v[0] for v in values)
+            count = len(values)
+            rows.append({
+                "url_name": name,
+                "count": count,
+                "p50": percentile(totals, 50),
+                "p95": percentile(totals, 95),
+                "p99": percentile(totals, 99),
+                "sql_ms": sum(v[1] for v in values) / count,
+                "sql_count": sum(v[2] for v in values) / count,
+                "template_ms": sum(v[3] for v in values) / count,
+                "slow_queries": slow.get(name, []),
+            })
+        return sorted(rows, key=lambda row: row["p95"], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._slow_queries.clear()
+
+
+store = MetricsStore()
@@ -0,0 +1,141 @@
+import contextvars
+import logging
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends import django as django_backend
+
+from .metrics import store
+
+logger = logging.getLogger(__name__)
+
+# Timings of the request being handled in the current thread/task.
+_current = contextvars.ContextVar("core_request_timings", default=None)
+
+# Slowest queries reported per request.
+SLOW_QUERIES_PER_REQUEST = 3
+
+
+class RequestTimings:
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.queries = []
+        self.template_ms = 0.0
+        self.template_depth = 0
+        # Async views run queries from several threads at once.
+        self._lock = threading.Lock()
+
+    def add_query(self, duration, sql):
+        with self._lock:
+            self.sql_count += 1
+            self.sql_ms += duration
+            self.queries.append((duration, sql))
+
+    def slowest_queries(self, limit=SLOW_QUERIES_PER_REQUEST):
+        return sorted(self.queries, reverse=True)[:limit]
+
+
+def _record_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add_query((time.perf_counter() - start) * 1000, sql)
+
+
+def _instrument(connection, **kwargs):
+    # Installed once per connection rather than per request, so queries run
+    # by worker threads (core/gather.py) are counted too. The wrapper is a
+    # no-op outside a request.
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+_original_template_render = django_backend.Template.render
+
+
+def _timed_template_render(self, context=None, request=None):
+    timings = _current.get()
+    if timings is None:
+        return _original_template_render(self, context, request)
+    # Only the outermost render is timed; nested renders are part of it.
+    timings.template_depth += 1
+    start = time.perf_counter()
+    try:
+        return _original_template_render(self, context, request)
+    finally:
+        timings.template_depth -= 1
+        if timings.template_depth == 0:
+            timings.template_ms += (time.perf_counter() - start) * 1000
+
+
+class RequestMetricsMiddleware:
+    """
+    Records SQL count, SQL time, the slowest queries and template render
+    time for every request. Emits them as a Server-Timing header and feeds
+    the per-URL percentiles shown at /dashboard/metrics/.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        django_backend.Template.render = _timed_template_render
+        connection_created.connect(_instrument, dispatch_uid="core.middleware.instrument")
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        try:
+            for connection in connections.all():
+                _instrument(connection)
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, timings, start)
+
+    async def __acall__(self, request):
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, timings, start)
+
+    def _finish(self, request, response, timings, start):
+        total_ms = (time.perf_counter() - start) * 1000
+
+        response["Server-Timing"] = ", ".join([
+            f'sql;dur={timings.sql_ms:.1f};desc="{timings.sql_count} queries"',
+            f"tpl;dur={timings.template_ms:.1f}",
+            f"total;dur={total_ms:.1f}",
+        ])
+
+        match = request.resolver_match
+        url_name = (match.view_name if match else None) or "<unresolved>"
+        slowest = timings.slowest_queries()
+        store.record(url_name, total_ms, timings.sql_ms, timings.sql_count, timings.template_ms, slowest)
+
+        if total_ms > settings.SLOW_REQUEST_MS:
+            logger.warning(
+                "Slow request %s %s (%s): %.0f ms, %d queries in %.0f ms, templates %.0f ms",
+                request.method, request.path, url_name, total_ms,
+                timings.sql_count, timings.sql_ms, timings.template_ms,
+            )
+        return response
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_heroimage_delete_sitesetting_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gallery",
+            index=models.Index(
+                fields=["-uploaded_at", "-id"], name="gallery_uploaded_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gallery",
+            index=models.Index(
+                fields=["related_project", "-uploaded_at", "-id"],
+                name="gallery_project_uploaded_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_gallery_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SiteStatistics",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("events_count", models.PositiveIntegerField(default=0)),
+                ("partners_count", models.PositiveIntegerField(default=0)),
+                ("volunteers_count", models.PositiveIntegerField(default=0)),
+                ("donations_count", models.PositiveIntegerField(default=0)),
+                (
+                    "donations_total",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Site statistics",
+            },
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:54
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import TextField
+from django.db.models.functions import Cast
+
+
+# The weighted vectors of core/search.py as of this migration, written out
+# here so later changes to that module cannot affect migrating from scratch.
+def _vector(*fields, weight):
+    return SearchVector(*fields, weight=weight, config="english")
+
+
+VECTORS = {
+    "Project": lambda: (
+        _vector("title", weight="A")
+        + _vector("short_description", "location", weight="B")
+        + _vector("description", weight="C")
+    ),
+    "Pillar": lambda: (
+        _vector("title", weight="A")
+        + _vector("short_description", weight="B")
+        + _vector("description", Cast("activities", TextField()), weight="C")
+    ),
+    "Event": lambda: (
+        _vector("title", weight="A")
+        + _vector("location", "organizer", weight="B")
+        + _vector("description", weight="C")
+    ),
+    "BlogPost": lambda: (
+        _vector("title", weight="A")
+        + _vector("category", weight="B")
+        + _vector("content", weight="C")
+    ),
+    "Gallery": lambda: _vector("title", weight="A") + _vector("description", weight="C"),
+}
+
+
+def build_search_vectors(apps, schema_editor):
+    for model_name, vector in VECTORS.items():
+        apps.get_model("core", model_name).objects.update(search_vector=vector())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="gallery",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="pillar",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="blogpost_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="event_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gallery",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="gallery_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pillar",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="pillar_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="project_search_idx"
+            ),
+        ),
+        migrations.RunPython(build_search_vectors, migrations.RunPython.noop),
+    ]
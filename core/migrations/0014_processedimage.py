@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_contact_outbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProcessedImage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("original_bytes", models.PositiveBigIntegerField()),
+                ("stored_bytes", models.PositiveBigIntegerField()),
+                ("width", models.PositiveIntegerField()),
+                ("height", models.PositiveIntegerField()),
+                ("processed_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
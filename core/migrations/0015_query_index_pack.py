@@ -0,0 +1,86 @@
+# Generated by Django 4.2.25 on 2026-10-18 12:09
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_processedimage"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="gallery",
+            name="related_pillar",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="gallery_images",
+                to="core.pillar",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="gallery",
+            name="related_project",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to="core.project",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="heroimage",
+            name="organization",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="hero_images",
+                to="core.organizationinfo",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="donation",
+            index=models.Index(fields=["-date", "-id"], name="donation_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["-date", "-id"], name="event_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("is_upcoming", True)),
+                fields=["-date", "-id"],
+                name="event_upcoming_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gallery",
+            index=models.Index(
+                fields=["related_pillar", "-uploaded_at", "-id"],
+                name="gallery_pillar_uploaded_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="heroimage",
+            index=models.Index(
+                fields=["organization", "order"], name="heroimage_org_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["-start_date", "-id"], name="project_start_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["status", "-start_date", "-id"], name="project_status_start_idx"
+            ),
+        ),
+    ]
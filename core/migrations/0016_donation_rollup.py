@@ -0,0 +1,47 @@
+# Generated by Django 4.2.25 on 2026-10-18 12:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0015_query_index_pack"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DonationRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("day", "Day"), ("week", "Week"), ("month", "Month")],
+                        max_length=5,
+                    ),
+                ),
+                ("bucket", models.DateField()),
+                ("method", models.CharField(max_length=50)),
+                ("donations_count", models.IntegerField(default=0)),
+                (
+                    "donations_total",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="donationrollup",
+            constraint=models.UniqueConstraint(
+                fields=("period", "bucket", "method"), name="donationrollup_bucket_uniq"
+            ),
+        ),
+    ]
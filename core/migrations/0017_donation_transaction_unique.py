@@ -0,0 +1,53 @@
+# Generated by Django 4.2.25 on 2026-10-18 12:14
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def rename_duplicate_transactions(apps, schema_editor):
+    """
+    Hand-entered donations may repeat a (method, transaction_id) pair. The
+    first row keeps the id; later ones get "-dup<pk>" appended so the
+    constraint can be added without deleting data. They are listed for
+    review, since most are the same donation entered twice.
+    """
+    Donation = apps.get_model("core", "Donation")
+    max_length = Donation._meta.get_field("transaction_id").max_length
+    duplicates = (
+        Donation.objects.exclude(transaction_id="")
+        .values("method", "transaction_id")
+        .annotate(rows=Count("id"), first=Min("id"))
+        .filter(rows__gt=1)
+    )
+    for group in duplicates:
+        rows = Donation.objects.filter(
+            method=group["method"], transaction_id=group["transaction_id"],
+        ).exclude(pk=group["first"])
+        for donation in rows.only("id", "transaction_id"):
+            suffix = f"-dup{donation.pk}"
+            renamed = donation.transaction_id[:max_length - len(suffix)] + suffix
+            Donation.objects.filter(pk=donation.pk).update(transaction_id=renamed)
+            print(
+                f"\n  Donation {donation.pk}: {group['method']} transaction {group['transaction_id']!r} "
+                f"duplicates donation {group['first']}; renamed to {renamed!r}",
+                end="",
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0016_donation_rollup"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_transactions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="donation",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("transaction_id", ""), _negated=True),
+                fields=("method", "transaction_id"),
+                name="donation_method_transaction_uniq",
+            ),
+        ),
+    ]
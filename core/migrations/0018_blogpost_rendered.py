@@ -0,0 +1,88 @@
+# Generated by Django 4.2.25 on 2026-10-18 12:17
+
+import math
+import re
+from html import unescape
+
+import markdown
+import nh3
+from django.db import migrations, models
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# core/blog.py render_content as of this migration, written out here so
+# later changes to that module cannot affect migrating from scratch.
+ALLOWED_TAGS = {
+    "a", "abbr", "b", "blockquote", "br", "code", "dd", "del", "dl", "dt", "em", "figcaption",
+    "figure", "h2", "h3", "h4", "h5", "h6", "hr", "i", "img", "li", "ol", "p", "pre", "strong",
+    "sub", "sup", "table", "tbody", "td", "th", "thead", "tr", "ul",
+}
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title"},
+    "abbr": {"title"},
+    "img": {"src", "alt", "title", "width", "height"},
+    "td": {"align"},
+    "th": {"align"},
+}
+
+
+def render_content(content):
+    html = nh3.clean(
+        markdown.markdown(content, extensions=["extra", "sane_lists"], output_format="html"),
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        link_rel="noopener noreferrer nofollow",
+    )
+    text = unescape(strip_tags(html))
+    words = len(re.findall(r"\w+", text))
+    excerpt = Truncator(" ".join(text.split())).words(40)
+    return html, excerpt, max(1, math.ceil(words / 200))
+
+
+def render_existing_posts(apps, schema_editor):
+    BlogPost = apps.get_model("core", "BlogPost")
+    for post in BlogPost.objects.only("id", "content").iterator():
+        post.content_html, post.excerpt, post.reading_time = render_content(post.content)
+        post.save(update_fields=["content_html", "excerpt", "reading_time"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0017_donation_transaction_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="content_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="blogpost",
+            name="excerpt",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="blogpost",
+            name="reading_time",
+            field=models.PositiveSmallIntegerField(
+                default=1, editable=False, help_text="Minutes"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="blogpost",
+            name="content",
+            field=models.TextField(
+                help_text="Markdown; inline HTML is allowed but sanitized."
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                fields=["published", "-created_at", "-id"],
+                name="blogpost_published_idx",
+            ),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
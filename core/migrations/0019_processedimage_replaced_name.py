@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 12:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0018_blogpost_rendered"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="processedimage",
+            name="replaced_name",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
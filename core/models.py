@@ -1,11 +1,16 @@
-from django.db import models
+from django.conf import settings
+from django.db import connection, models, transaction
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db.models import JSONField
+from django.utils import timezone
 
 class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
+    subject = models.CharField(max_length=200, blank=True)
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -13,14 +18,63 @@ class ContactMessage(models.Model):
         return f"{self.name} ({self.email})"
 
 
+class OutboxEmail(models.Model):
+    """
+    Email queued for delivery by `manage.py send_outbox`, so requests never
+    wait on SMTP. Failed sends are retried with exponential backoff.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254, blank=True)
+    to = ArrayField(models.EmailField())
+    reply_to = models.EmailField(blank=True)
+    contact_message = models.ForeignKey(ContactMessage, on_delete=models.SET_NULL, null=True, blank=True, related_name='notifications')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The worker's claim query: pending rows that are due, oldest first.
+            models.Index(fields=['next_attempt_at', 'id'], condition=models.Q(status='pending'), name='outbox_pending_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
+
+
 class Gallery(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     image = models.ImageField(upload_to='media/gallery/')
     related_event = models.ForeignKey('Event', on_delete=models.SET_NULL, null=True, blank=True)
-    related_project = models.ForeignKey('Project', on_delete=models.SET_NULL, null=True, blank=True)
-    related_pillar = models.ForeignKey('Pillar', on_delete=models.SET_NULL, null=True, blank=True, related_name='gallery_images')
+    # No single-column FK indexes: the composite indexes below lead with these columns.
+    related_project = models.ForeignKey('Project', on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
+    related_pillar = models.ForeignKey('Pillar', on_delete=models.SET_NULL, null=True, blank=True, related_name='gallery_images', db_index=False)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Full-text search document, maintained by core/signals.py (see core/search.py)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination on the public gallery: (uploaded_at, id) DESC,
+            # unfiltered and per project.
+            models.Index(fields=['-uploaded_at', '-id'], name='gallery_uploaded_idx'),
+            models.Index(fields=['related_project', '-uploaded_at', '-id'], name='gallery_project_uploaded_idx'),
+            # Newest images per pillar (core/prefetch.py window on home and pillars).
+            models.Index(fields=['related_pillar', '-uploaded_at', '-id'], name='gallery_pillar_uploaded_idx'),
+            GinIndex(fields=['search_vector'], name='gallery_search_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -62,18 +116,24 @@ class OrganizationInfo(models.Model):
     meta_description = models.TextField(blank=True)
     meta_keywords = models.CharField(max_length=255, blank=True)
 
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.name
 
 class HeroImage(models.Model):
-    organization = models.ForeignKey(OrganizationInfo, on_delete=models.CASCADE, related_name='hero_images')
+    organization = models.ForeignKey(OrganizationInfo, on_delete=models.CASCADE, related_name='hero_images', db_index=False)
     image = models.ImageField(upload_to='media/hero/')
     caption = models.CharField(max_length=255, blank=True)
     order = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            # org_info.hero_images.all(): filter by organization, ordered by order.
+            models.Index(fields=['organization', 'order'], name='heroimage_org_order_idx'),
+        ]
 
     def __str__(self):
         return f"Hero Image {self.id} for {self.organization.name}"
@@ -91,6 +151,13 @@ class Pillar(models.Model):
         default=list,
         help_text="A list of activities displayed on detailed page & home page"
     )
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='pillar_search_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -118,6 +185,16 @@ class Project(models.Model):
         help_text="Enter a list of impact points. Each entry can be long or short."
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='project_search_idx'),
+            # Dashboard project list: newest first, optionally filtered by status.
+            models.Index(fields=['-start_date', '-id'], name='project_start_idx'),
+            models.Index(fields=['status', '-start_date', '-id'], name='project_status_start_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -126,6 +203,7 @@ class ProjectMedia(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='media')
     image = models.ImageField(upload_to='media/project_media/')
     caption = models.CharField(max_length=255, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return f"Media for {self.project.title}"
@@ -139,6 +217,16 @@ class Event(models.Model):
     registration_link = models.URLField(blank=True)
     image = models.ImageField(upload_to='media/events/', blank=True)
     is_upcoming = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='event_search_idx'),
+            # Dashboard event list: newest first; upcoming events get a partial index.
+            models.Index(fields=['-date', '-id'], name='event_date_idx'),
+            models.Index(fields=['-date', '-id'], condition=models.Q(is_upcoming=True), name='event_upcoming_date_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -157,6 +245,7 @@ class Partner(models.Model):
     description = models.TextField(blank=True)
     logo = models.ImageField(upload_to='media/partners/', blank=True)
     website = models.URLField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.name
@@ -170,6 +259,7 @@ class TeamMember(models.Model):
     photo = models.ImageField(upload_to='media/team/', blank=True)
     contact_email = models.EmailField(blank=True)
     phone = models.CharField(max_length=20, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.name
@@ -178,11 +268,25 @@ class BlogPost(models.Model):
     title = models.CharField(max_length=255)
     slug = models.SlugField(unique=True)
     author = models.ForeignKey(TeamMember, on_delete=models.SET_NULL, null=True)
-    content = models.TextField()
+    content = models.TextField(help_text="Markdown; inline HTML is allowed but sanitized.")
     image = models.ImageField(upload_to='media/blog/', blank=True)
     category = models.CharField(max_length=100, blank=True)
     published = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Derived from content on save (core/blog.py) so requests never render Markdown.
+    content_html = models.TextField(blank=True, editable=False)
+    excerpt = models.TextField(blank=True, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False, help_text="Minutes")
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='blogpost_search_idx'),
+            # Public blog list: published posts, newest first, keyset-paginated.
+            models.Index(fields=['published', '-created_at', '-id'], name='blogpost_published_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -209,10 +313,158 @@ class Donation(models.Model):
     transaction_id = models.CharField(max_length=100, blank=True)
     date = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Date-range reporting and newest-first listings.
+            models.Index(fields=['-date', '-id'], name='donation_date_idx'),
+        ]
+        constraints = [
+            # Statement imports skip rows already recorded. Manual entries
+            # without a transaction ID are not deduplicated.
+            models.UniqueConstraint(
+                fields=['method', 'transaction_id'],
+                condition=~models.Q(transaction_id=''),
+                name='donation_method_transaction_uniq',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.donor_name} - {self.amount}"
 
 
+class ProcessedImage(models.Model):
+    """
+    An uploaded original that went through ingest normalization
+    (core/images.py), with its size before and after.
+
+    ``replaced_name`` is the pre-normalization file, kept on storage until
+    cached pages can no longer link to it (purge_replaced_images).
+    """
+    name = models.CharField(max_length=255, unique=True)
+    replaced_name = models.CharField(max_length=255, blank=True)
+    original_bytes = models.PositiveBigIntegerField()
+    stored_bytes = models.PositiveBigIntegerField()
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    processed_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def saved_bytes(self):
+        return self.original_bytes - self.stored_bytes
+
+
+class SiteStatistics(models.Model):
+    """
+    Single-row rollup of the dashboard totals. Counters are adjusted with
+    F() expressions by the signals in core/signals.py, so reading them is
+    O(1) regardless of table size.
+    """
+    events_count = models.PositiveIntegerField(default=0)
+    partners_count = models.PositiveIntegerField(default=0)
+    volunteers_count = models.PositiveIntegerField(default=0)
+    donations_count = models.PositiveIntegerField(default=0)
+    donations_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
 
+    class Meta:
+        verbose_name_plural = "Site statistics"
 
+    def __str__(self):
+        return "Site statistics"
+
+    @classmethod
+    def load(cls):
+        try:
+            return cls.objects.get(pk=1)
+        except cls.DoesNotExist:
+            return cls.rebuild()
+
+    @classmethod
+    def rebuild(cls):
+        """Recomputes every counter from the source tables."""
+        donations = Donation.objects.aggregate(
+            count=models.Count('id'),
+            total=models.Sum('amount'),
+        )
+        stats, _ = cls.objects.update_or_create(pk=1, defaults={
+            "events_count": Event.objects.count(),
+            "partners_count": Partner.objects.count(),
+            "volunteers_count": VolunteerApplication.objects.count(),
+            "donations_count": donations['count'],
+            "donations_total": donations['total'] or 0,
+        })
+        return stats
+
+    @classmethod
+    def adjust(cls, **deltas):
+        """Atomically applies counter deltas, e.g. adjust(events_count=1)."""
+        cls.objects.filter(pk=1).update(**{
+            field: models.F(field) + delta for field, delta in deltas.items()
+        })
+
+
+class DonationRollup(models.Model):
+    """
+    Donation count and total per (period, bucket, method), where bucket is
+    the first local day of the day/week/month. Kept current by the Donation
+    signals in core/signals.py, so charts read a few dozen rows instead of
+    aggregating the donations table.
+    """
+    PERIOD_CHOICES = [
+        ('day', 'Day'),
+        ('week', 'Week'),
+        ('month', 'Month'),
+    ]
+    PERIODS = [choice for choice, _ in PERIOD_CHOICES]
 
+    period = models.CharField(max_length=5, choices=PERIOD_CHOICES)
+    bucket = models.DateField()
+    method = models.CharField(max_length=50)
+    donations_count = models.IntegerField(default=0)
+    donations_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['period', 'bucket', 'method'], name='donationrollup_bucket_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.period} {self.bucket} {self.method}: {self.donations_total}"
+
+    @classmethod
+    def rebuild(cls):
+        """Recomputes every bucket from the donations table with one date_trunc GROUP BY."""
+        table, source = cls._meta.db_table, Donation._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (period, bucket, method, donations_count, donations_total)
+                SELECT period, date_trunc(period, d.date AT TIME ZONE %s)::date, d.method, COUNT(*), SUM(d.amount)
+                FROM {source} d CROSS JOIN unnest(%s::varchar[]) AS period
+                GROUP BY 1, 2, 3
+                """,
+                [settings.TIME_ZONE, cls.PERIODS],
+            )
+        return cls.objects.count()
+
+    @classmethod
+    def adjust(cls, date, method, count, amount):
+        """
+        Atomically adds ``count`` donations worth ``amount`` to the day, week
+        and month buckets containing ``date`` (negative values subtract).
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {cls._meta.db_table} AS r (period, bucket, method, donations_count, donations_total)
+                SELECT period, date_trunc(period, %s::timestamptz AT TIME ZONE %s)::date, %s, %s, %s
+                FROM unnest(%s::varchar[]) AS period
+                ON CONFLICT (period, bucket, method) DO UPDATE SET
+                    donations_count = r.donations_count + EXCLUDED.donations_count,
+                    donations_total = r.donations_total + EXCLUDED.donations_total
+                """,
+                [date, settings.TIME_ZONE, method, count, amount, cls.PERIODS],
+            )
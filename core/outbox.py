@@ -0,0 +1,115 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OrganizationInfo, OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 6
+# Retry delays double from RETRY_BASE_SECONDS up to RETRY_MAX_SECONDS.
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 60 * 60
+
+
+def contact_recipients():
+    """CONTACT_NOTIFICATION_EMAILS, falling back to the organization's contact email."""
+    if settings.CONTACT_NOTIFICATION_EMAILS:
+        return list(settings.CONTACT_NOTIFICATION_EMAILS)
+    org_info = OrganizationInfo.objects.only("contact_email").first()
+    return [org_info.contact_email] if org_info and org_info.contact_email else []
+
+
+def enqueue_contact_notification(contact_message):
+    """Queues the staff notification for a contact form submission; returns it, or None without recipients."""
+    recipients = contact_recipients()
+    if not recipients:
+        logger.warning("No recipients for contact message %s; nothing queued", contact_message.pk)
+        return None
+    return OutboxEmail.objects.create(
+        subject=f"[Website contact] {contact_message.subject or 'New message'}"[:255],
+        body=(
+            f"From: {contact_message.name} <{contact_message.email}>\n"
+            f"Subject: {contact_message.subject}\n\n"
+            f"{contact_message.message}\n"
+        ),
+        to=recipients,
+        reply_to=contact_message.email,
+        contact_message=contact_message,
+    )
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS))
+
+
+def _to_message(email, connection):
+    return EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email or None,
+        to=email.to,
+        reply_to=[email.reply_to] if email.reply_to else None,
+        connection=connection,
+    )
+
+
+def deliver_batch(batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    """
+    Sends up to ``batch_size`` due emails over a single SMTP connection and
+    returns (sent, retried, failed).
+
+    Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    workers never send the same email. A failed send is rescheduled with
+    exponential backoff; after ``max_attempts`` it is marked failed.
+    """
+    sent = retried = failed = 0
+    with transaction.atomic():
+        batch = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_at__lte=timezone.now())
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if not batch:
+            return sent, retried, failed
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+            connection_error = None
+        except Exception as exc:  # every row in the batch is retried
+            connection_error = exc
+
+        for email in batch:
+            error = connection_error
+            if error is None:
+                try:
+                    connection.send_messages([_to_message(email, connection)])
+                except Exception as exc:
+                    error = exc
+
+            email.attempts += 1
+            if error is None:
+                email.status = "sent"
+                email.sent_at = timezone.now()
+                email.last_error = ""
+                sent += 1
+            else:
+                email.last_error = f"{type(error).__name__}: {error}"
+                if email.attempts >= max_attempts:
+                    email.status = "failed"
+                    failed += 1
+                    logger.error("Giving up on outbox email %s after %d attempts: %s", email.pk, email.attempts, error)
+                else:
+                    email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+                    retried += 1
+
+        if connection_error is None:
+            connection.close()
+        OutboxEmail.objects.bulk_update(batch, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"])
+    return sent, retried, failed
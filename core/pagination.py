@@ -0,0 +1,72 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+def querystring(params, **changes):
+    """
+    "?query" for ``params`` (a QueryDict) with ``changes`` applied; a value
+    of None drops the parameter. Used for cursor, page and sort links.
+    """
+    query = params.copy()
+    for key, value in changes.items():
+        if value is None:
+            query.pop(key, None)
+        else:
+            query[key] = value
+    encoded = query.urlencode()
+    return f"?{encoded}" if encoded else "?"
+
+
+def encode_cursor(value, pk):
+    """Opaque, URL-safe cursor for the row (value, pk)."""
+    raw = json.dumps([value.isoformat() if hasattr(value, "isoformat") else value, pk])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, model, field):
+    """
+    Returns (value, pk) for a cursor produced by encode_cursor, or None if
+    the cursor is missing or malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = model._meta.get_field(field).to_python(value)
+        if value is None:
+            # Sort fields are non-null; None could not be compared in SQL.
+            return None
+        return value, int(pk)
+    except (ValueError, TypeError, ValidationError):
+        return None
+
+
+def keyset_page(queryset, cursor=None, page_size=24, field="uploaded_at"):
+    """
+    Keyset (seek) pagination ordered by ``field`` DESC, ``id`` DESC.
+    ``queryset`` may be a .values() queryset that includes ``field`` and id.
+
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    Unlike OFFSET pagination, each page costs the same index range scan no
+    matter how deep the visitor scrolls.
+    """
+    queryset = queryset.order_by(f"-{field}", "-id")
+    position = decode_cursor(cursor, queryset.model, field)
+    if position:
+        value, pk = position
+        queryset = queryset.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk}))
+
+    items = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        if isinstance(last, dict):  # a .values() queryset
+            next_cursor = encode_cursor(last[field], last["id"])
+        else:
+            next_cursor = encode_cursor(getattr(last, field), last.pk)
+    return items, next_cursor
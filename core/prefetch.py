@@ -0,0 +1,44 @@
+from collections import defaultdict
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+
+def prefetch_top_related(instances, queryset, fk_name, limit, order_by=("-uploaded_at", "-id"), to_attr="top_related"):
+    """
+    Attaches the first ``limit`` rows of ``queryset`` related to each of
+    ``instances`` through ``fk_name`` as a list on ``to_attr``.
+
+    prefetch_related() cannot apply a per-parent slice, so this runs a single
+    windowed query instead of one query per parent:
+
+        ROW_NUMBER() OVER (PARTITION BY <fk_name> ORDER BY <order_by>) <= limit
+
+    Example:
+        prefetch_top_related(pillars, Gallery.objects.all(), "related_pillar", 2, to_attr="top_gallery_images")
+    """
+    instances = list(instances)
+    for instance in instances:
+        setattr(instance, to_attr, [])
+    if not instances:
+        return instances
+
+    fk_attname = queryset.model._meta.get_field(fk_name).attname
+    ordering = [
+        F(field[1:]).desc() if field.startswith("-") else F(field).asc()
+        for field in order_by
+    ]
+    rows = (
+        queryset
+        .filter(**{f"{fk_attname}__in": [instance.pk for instance in instances]})
+        .annotate(_row_number=Window(RowNumber(), partition_by=[F(fk_attname)], order_by=ordering))
+        .filter(_row_number__lte=limit)
+        .order_by(fk_attname, *order_by)
+    )
+
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[getattr(row, fk_attname)].append(row)
+    for instance in instances:
+        setattr(instance, to_attr, grouped[instance.pk])
+    return instances
@@ -0,0 +1,164 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db.models import CharField, F, TextField, Value
+from django.db.models.functions import Cast
+from django.urls import reverse
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .models import BlogPost, Event, Gallery, Pillar, Project
+
+SEARCH_CONFIG = "english"
+
+# Markers placed around matches by ts_headline; swapped for <mark> after escaping.
+_HIGHLIGHT_START = "\x02"
+_HIGHLIGHT_STOP = "\x03"
+
+
+def _vector(*fields, weight):
+    return SearchVector(*fields, weight=weight, config=SEARCH_CONFIG)
+
+
+# Per searchable model: the stored vector, the queryset exposed to the
+# public, the field shown as the title, the field excerpted in results and
+# how to link to a hit (from the row's values; "url_fields" lists columns
+# the link needs beyond the id).
+SEARCHABLE = {
+    "project": {
+        "model": Project,
+        "vector": lambda: (
+            _vector("title", weight="A")
+            + _vector("short_description", "location", weight="B")
+            + _vector("description", weight="C")
+        ),
+        "queryset": lambda: Project.objects.all(),
+        "title": "title",
+        "excerpt": "description",
+        "url": lambda row: reverse("project_detail", args=[row["id"]]),
+    },
+    "pillar": {
+        "model": Pillar,
+        "vector": lambda: (
+            _vector("title", weight="A")
+            + _vector("short_description", weight="B")
+            + _vector("description", Cast("activities", TextField()), weight="C")
+        ),
+        "queryset": lambda: Pillar.objects.all(),
+        "title": "title",
+        "excerpt": "description",
+        "url": lambda row: f"{reverse('pillars')}#pillar-{row['id']}",
+    },
+    "event": {
+        "model": Event,
+        "vector": lambda: (
+            _vector("title", weight="A")
+            + _vector("location", "organizer", weight="B")
+            + _vector("description", weight="C")
+        ),
+        "queryset": lambda: Event.objects.all(),
+        "title": "title",
+        "excerpt": "description",
+        "url": lambda row: None,
+    },
+    "blog": {
+        "model": BlogPost,
+        "vector": lambda: (
+            _vector("title", weight="A")
+            + _vector("category", weight="B")
+            + _vector("content", weight="C")
+        ),
+        "queryset": lambda: BlogPost.objects.filter(published=True),
+        "title": "title",
+        "excerpt": "content",
+        "url_fields": ["slug"],
+        "url": lambda row: reverse("blog_post", args=[row["slug"]]),
+    },
+    "gallery": {
+        "model": Gallery,
+        "vector": lambda: _vector("title", weight="A") + _vector("description", weight="C"),
+        "queryset": lambda: Gallery.objects.all(),
+        "title": "title",
+        "excerpt": "description",
+        "url": lambda row: reverse("gallery"),
+    },
+}
+
+SEARCHABLE_MODELS = {config["model"]: kind for kind, config in SEARCHABLE.items()}
+
+
+def update_search_vector(model, pks):
+    """Recomputes the stored search_vector of the given rows in one UPDATE."""
+    kind = SEARCHABLE_MODELS[model]
+    return model.objects.filter(pk__in=pks).update(search_vector=SEARCHABLE[kind]["vector"]())
+
+
+def rebuild_search_vectors():
+    """Recomputes every stored search vector; returns {kind: rows updated}."""
+    return {
+        kind: config["model"].objects.update(search_vector=config["vector"]())
+        for kind, config in SEARCHABLE.items()
+    }
+
+
+def _highlight(headline):
+    html = escape(headline or "")
+    return mark_safe(html.replace(_HIGHLIGHT_START, "<mark>").replace(_HIGHLIGHT_STOP, "</mark>"))
+
+
+def search(text, offset=0, limit=20):
+    """
+    Ranked full-text search over every searchable model.
+
+    Ranking runs as one UNION ALL over the GIN-indexed search_vector
+    columns, returning only (kind, id, rank) for the requested page.
+    Titles and highlighted excerpts are then fetched for that page alone,
+    so ts_headline never runs over the whole match set.
+
+    Returns (results, has_next).
+    """
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+    ranked = [
+        config["queryset"]()
+        .filter(search_vector=query)
+        .annotate(kind=Value(kind, output_field=CharField()), rank=SearchRank(F("search_vector"), query))
+        .values_list("kind", "id", "rank")
+        .order_by()
+        for kind, config in SEARCHABLE.items()
+    ]
+    page = list(ranked[0].union(*ranked[1:], all=True).order_by("-rank", "kind", "id")[offset:offset + limit + 1])
+    has_next = len(page) > limit
+    page = page[:limit]
+
+    wanted = {}
+    for kind, pk, _ in page:
+        wanted.setdefault(kind, []).append(pk)
+
+    details = {}
+    for kind, pks in wanted.items():
+        config = SEARCHABLE[kind]
+        rows = (
+            config["model"].objects.filter(pk__in=pks)
+            .annotate(headline=SearchHeadline(
+                config["excerpt"], query, config=SEARCH_CONFIG,
+                start_sel=_HIGHLIGHT_START, stop_sel=_HIGHLIGHT_STOP,
+                max_words=35, min_words=15,
+            ))
+            .values("id", config["title"], "headline", *config.get("url_fields", []))
+        )
+        for row in rows:
+            details[(kind, row["id"])] = row
+
+    results = []
+    for kind, pk, rank in page:
+        if (kind, pk) not in details:
+            continue
+        row = details[(kind, pk)]
+        results.append({
+            "kind": kind,
+            "id": pk,
+            "title": row[SEARCHABLE[kind]["title"]],
+            "excerpt": _highlight(row["headline"]),
+            "url": SEARCHABLE[kind]["url"](row),
+            "rank": rank,
+        })
+    return results, has_next
@@ -0,0 +1,188 @@
+import mimetypes
+import os
+import re
+from functools import lru_cache
+from urllib.parse import quote
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.urls import re_path
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+# Content-hashed static names never change, so browsers may keep them for a year.
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+# Everything else (unhashed static, uploaded media) is revalidated hourly.
+DEFAULT_MAX_AGE = 60 * 60
+
+# Precompressed siblings written by core.storage, in order of preference.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_UNSATISFIABLE = object()
+
+
+class _FileRange:
+    """
+    File wrapper that stops reading after ``length`` bytes. fileno() and
+    tell() are passed through, so servers with a sendfile-based
+    wsgi.file_wrapper (gunicorn, uwsgi) still send the range zero-copy,
+    bounded by the Content-Length header.
+    """
+
+    def __init__(self, file, start, length):
+        self._file = file
+        self._remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b""
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def tell(self):
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+@lru_cache(maxsize=1)
+def _hashed_static_names():
+    return frozenset(getattr(staticfiles_storage, "hashed_files", {}).values())
+
+
+def _is_immutable(kind, path):
+    return kind == "static" and path in _hashed_static_names()
+
+
+def _parse_range(header, size):
+    """
+    Returns (start, end) for a single satisfiable byte range, _UNSATISFIABLE,
+    or None when the header should be ignored (multiple ranges, garbage).
+    """
+    match = _RANGE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return _UNSATISFIABLE
+        return start, end
+    suffix = int(last)
+    if suffix == 0 or size == 0:
+        return _UNSATISFIABLE
+    return max(size - suffix, 0), size - 1
+
+
+def _pick_encoding(request, full_path):
+    accepted = request.headers.get("Accept-Encoding", "")
+    for encoding, suffix in ENCODINGS:
+        if encoding in accepted and os.path.isfile(full_path + suffix):
+            return encoding, full_path + suffix
+    return None, full_path
+
+
+def _finish(response, kind, path, etag, mtime, encoding):
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = http_date(mtime)
+    if kind == "static":
+        patch_vary_headers(response, ["Accept-Encoding"])
+    if _is_immutable(kind, path):
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=DEFAULT_MAX_AGE)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+
+@require_safe
+def serve_file(request, path, document_root, kind):
+    """
+    Serves a file from ``document_root`` when DEBUG is off.
+
+    Answers If-None-Match / If-Modified-Since with 304. Serves .br or .gz
+    siblings to clients that accept them, and single byte ranges with 206.
+    Hashed static names get a one-year immutable Cache-Control. The body is
+    a FileResponse over the OS file handle so the WSGI server can use
+    sendfile. With FILES_ACCEL_REDIRECT_PREFIX set, delivery is handed to
+    nginx through X-Accel-Redirect instead.
+    """
+    try:
+        full_path = safe_join(document_root, path)
+    except SuspiciousFileOperation:
+        raise Http404("Invalid path.")
+    if not path or not os.path.isfile(full_path):
+        raise Http404("File not found.")
+
+    content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+
+    if settings.FILES_ACCEL_REDIRECT_PREFIX:
+        stat = os.stat(full_path)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        response = HttpResponse(content_type=content_type)
+        response.headers["X-Accel-Redirect"] = quote(f"{settings.FILES_ACCEL_REDIRECT_PREFIX}{kind}/{path}")
+        return _finish(response, kind, path, etag, stat.st_mtime, None)
+
+    encoding, file_path = _pick_encoding(request, full_path) if kind == "static" else (None, full_path)
+    stat = os.stat(file_path)
+    # Each encoding is a different representation and needs its own ETag.
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if not_modified is not None:
+        return _finish(not_modified, kind, path, etag, stat.st_mtime, None)
+
+    byte_range = None
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and not encoding and if_range in (None, etag, http_date(stat.st_mtime)):
+        byte_range = _parse_range(range_header, stat.st_size)
+
+    if byte_range is _UNSATISFIABLE:
+        response = HttpResponse(status=416)
+        response.headers["Content-Range"] = f"bytes */{stat.st_size}"
+        return _finish(response, kind, path, etag, stat.st_mtime, None)
+
+    file = open(file_path, "rb")
+    if byte_range:
+        start, end = byte_range
+        response = FileResponse(_FileRange(file, start, end - start + 1), status=206, content_type=content_type)
+        response.headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+        response.headers["Content-Length"] = str(end - start + 1)
+    else:
+        response = FileResponse(file, content_type=content_type)
+        response.headers["Content-Length"] = str(stat.st_size)
+    response.headers.pop("Content-Disposition", None)
+    response.headers["Accept-Ranges"] = "bytes"
+    return _finish(response, kind, path, etag, stat.st_mtime, encoding)
+
+
+def file_urlpatterns():
+    """URL patterns serving STATIC_URL from STATIC_ROOT and MEDIA_URL from MEDIA_ROOT."""
+    patterns = []
+    for kind, prefix, root in (
+        ("static", settings.STATIC_URL, settings.STATIC_ROOT),
+        ("media", settings.MEDIA_URL, settings.MEDIA_ROOT),
+    ):
+        if root:
+            patterns.append(re_path(
+                rf"^{re.escape(prefix.lstrip('/'))}(?P<path>.*)$",
+                serve_file,
+                {"document_root": str(root), "kind": kind},
+            ))
+    return patterns
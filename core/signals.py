@@ -0,0 +1,167 @@
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import ImageField
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .caching import bump_content_version, bump_model_versions
+from .background import run_in_background
+from .blog import render_content
+from .images import available_renditions, process_upload
+from .models import (
+    BlogPost,
+    ContactMessage,
+    ProcessedImage,
+    Donation,
+    DonationRollup,
+    Event,
+    Gallery,
+    HeroImage,
+    OutboxEmail,
+    Partner,
+    Project,
+    SiteStatistics,
+    TeamMember,
+    VolunteerApplication,
+)
+from .search import SEARCHABLE_MODELS, update_search_vector
+
+# Row counters in SiteStatistics, per model.
+COUNTED_MODELS = {
+    Event: "events_count",
+    Partner: "partners_count",
+    VolunteerApplication: "volunteers_count",
+}
+
+# Image fields that get responsive renditions (see core/images.py).
+RESPONSIVE_IMAGE_FIELDS = {
+    Gallery: ["image"],
+    Project: ["image"],
+    HeroImage: ["image"],
+    Partner: ["logo"],
+    TeamMember: ["photo"],
+}
+
+# Every image field, normalized on upload (see core/images.py).
+UPLOADED_IMAGE_FIELDS = {
+    model: names
+    for model in apps.get_app_config("core").get_models()
+    if (names := [field.name for field in model._meta.fields if isinstance(field, ImageField)])
+}
+
+
+def count_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        SiteStatistics.adjust(**{COUNTED_MODELS[sender]: 1})
+
+
+def count_deleted(sender, instance, **kwargs):
+    SiteStatistics.adjust(**{COUNTED_MODELS[sender]: -1})
+
+
+for model in COUNTED_MODELS:
+    post_save.connect(count_created, sender=model, dispatch_uid=f"count_created_{model.__name__}")
+    post_delete.connect(count_deleted, sender=model, dispatch_uid=f"count_deleted_{model.__name__}")
+
+
+@receiver(pre_save, sender=Donation)
+def remember_donation_amount(sender, instance, raw=False, **kwargs):
+    """Keep the stored row so an edit can apply the difference to the rollups."""
+    instance._previous_amount = instance._previous = None
+    if instance.pk and not raw:
+        instance._previous = (
+            sender.objects.filter(pk=instance.pk).values_list("amount", "method", "date").first()
+        )
+        if instance._previous:
+            instance._previous_amount = instance._previous[0]
+
+
+@receiver(post_save, sender=Donation)
+def count_donation_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created or instance._previous_amount is None:
+        SiteStatistics.adjust(donations_count=1, donations_total=instance.amount)
+    elif instance.amount != instance._previous_amount:
+        SiteStatistics.adjust(donations_total=instance.amount - instance._previous_amount)
+
+    current = (instance.amount, instance.method, instance.date)
+    if instance._previous != current:
+        if instance._previous:
+            amount, method, date = instance._previous
+            DonationRollup.adjust(date, method, -1, -amount)
+        DonationRollup.adjust(instance.date, instance.method, 1, instance.amount)
+
+
+@receiver(post_delete, sender=Donation)
+def count_donation_deleted(sender, instance, **kwargs):
+    SiteStatistics.adjust(donations_count=-1, donations_total=-instance.amount)
+    DonationRollup.adjust(instance.date, instance.method, -1, -instance.amount)
+
+
+@receiver(pre_save, sender=BlogPost)
+def render_blog_post(sender, instance, raw=False, **kwargs):
+    """Store the sanitized HTML, excerpt and reading time with the post."""
+    if not raw:
+        instance.content_html, instance.excerpt, instance.reading_time = render_content(instance.content)
+
+
+def refresh_search_vector(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_search_vector(sender, [instance.pk])
+
+
+for model in SEARCHABLE_MODELS:
+    post_save.connect(refresh_search_vector, sender=model, dispatch_uid=f"search_vector_{model.__name__}")
+
+
+def process_uploaded_images(sender, instance, raw=False, **kwargs):
+    """
+    Queues normalization (and renditions, for responsive fields) of newly
+    uploaded images once the save has committed.
+    """
+    if raw:
+        return
+    responsive = RESPONSIVE_IMAGE_FIELDS.get(sender, [])
+    for field_name in UPLOADED_IMAGE_FIELDS[sender]:
+        field_file = getattr(instance, field_name)
+        if not field_file:
+            continue
+        needs_renditions = field_name in responsive and not available_renditions(field_file)
+        if needs_renditions or not ProcessedImage.objects.filter(name=field_file.name).exists():
+            transaction.on_commit(partial(
+                run_in_background, process_upload, sender, instance.pk, field_name, field_name in responsive,
+            ))
+
+
+for model in UPLOADED_IMAGE_FIELDS:
+    post_save.connect(process_uploaded_images, sender=model, dispatch_uid=f"uploaded_images_{model.__name__}")
+
+
+def bump_content_version_on_change(sender, **kwargs):
+    """
+    Any change to site content invalidates every cached public page, and the
+    cached fragments that show this model.
+    """
+    bump_content_version()
+    bump_model_versions(sender)
+
+
+# Never shown on public pages; writing them must not invalidate the page cache.
+PRIVATE_MODELS = {
+    ContactMessage,
+    Donation,
+    DonationRollup,
+    OutboxEmail,
+    ProcessedImage,
+    SiteStatistics,
+    VolunteerApplication,
+}
+
+for model in apps.get_app_config("core").get_models():
+    if model in PRIVATE_MODELS:
+        continue
+    post_save.connect(bump_content_version_on_change, sender=model, dispatch_uid=f"content_version_save_{model.__name__}")
+    post_delete.connect(bump_content_version_on_change, sender=model, dispatch_uid=f"content_version_delete_{model.__name__}")
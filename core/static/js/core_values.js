@@ -16,10 +16,10 @@ document.addEventListener("DOMContentLoaded", function () {
             row.innerHTML = `
                 <div class="flex-1 space-y-2">
                     <input type="text" placeholder="Title (e.g. Co-operation)" 
-                           class="w-full p-2 border rounded focus:ring-2 focus:ring-green-500 font-bold text-gray-800"
+                           class="w-full p-2 border rounded-sm focus:ring-2 focus:ring-green-500 font-bold text-gray-800"
                            value="${item.title || ''}" data-index="${index}" data-field="title">
                     <textarea placeholder="Description" rows="2"
-                              class="w-full p-2 border rounded focus:ring-2 focus:ring-green-500 text-sm text-gray-600"
+                              class="w-full p-2 border rounded-sm focus:ring-2 focus:ring-green-500 text-sm text-gray-600"
                               data-index="${index}" data-field="description">${item.description || ''}</textarea>
                 </div>
                 <button type="button" class="text-red-500 hover:text-red-700 p-2" onclick="removeCoreValue(${index})">
@@ -0,0 +1,47 @@
+// Infinite scroll for the public gallery: fetches the next batch of cards
+// from the gallery_more endpoint when the sentinel scrolls into view.
+const grid = document.getElementById("gallery-grid");
+const sentinel = document.getElementById("gallery-sentinel");
+
+if (grid && sentinel) {
+    let loading = false;
+
+    async function loadMore() {
+        if (loading || !sentinel.dataset.cursor) return;
+        loading = true;
+
+        const params = new URLSearchParams({ cursor: sentinel.dataset.cursor });
+        if (sentinel.dataset.project) {
+            params.set("project", sentinel.dataset.project);
+        }
+
+        try {
+            const response = await fetch(`${sentinel.dataset.url}?${params}`, {
+                headers: { "Accept": "application/json" },
+            });
+            if (!response.ok) throw new Error(response.statusText);
+            const data = await response.json();
+
+            grid.insertAdjacentHTML("beforeend", data.html);
+            if (data.next_cursor) {
+                sentinel.dataset.cursor = data.next_cursor;
+            } else {
+                observer.disconnect();
+                sentinel.remove();
+            }
+        } catch {
+            sentinel.textContent = "Could not load more photos.";
+            observer.disconnect();
+        } finally {
+            loading = false;
+        }
+    }
+
+    const observer = new IntersectionObserver((entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+            loadMore();
+        }
+    }, { rootMargin: "600px 0px" });
+
+    observer.observe(sentinel);
+}
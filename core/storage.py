@@ -0,0 +1,47 @@
+import gzip
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz siblings are written without it
+    brotli = None
+
+# Binary formats (images, woff2) are already compressed.
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".xml", ".ttf", ".eot", ".otf")
+# Below this size the encoded sibling is not worth the extra file.
+MIN_COMPRESS_SIZE = 512
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage (content-hashed file names) that also writes .gz and,
+    when the brotli package is installed, .br siblings of every hashed text
+    asset during collectstatic, so they can be served precompressed.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        for name in set(self.hashed_files.values()):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                self._write_compressed(name)
+
+    def _write_compressed(self, name):
+        with self.open(name) as original:
+            content = original.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return
+
+        encoders = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoders.append((".br", lambda data: brotli.compress(data, quality=11)))
+
+        for suffix, encode in encoders:
+            compressed = encode(content)
+            if len(compressed) >= len(content):
+                continue
+            path = self.path(name + suffix)
+            with open(path, "wb") as handle:
+                handle.write(compressed)
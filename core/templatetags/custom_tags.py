@@ -1,7 +1,101 @@
 from django import template
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.html import format_html, format_html_join
+
+from core.caching import fragment_cache_key
+from core.images import MIME_TYPES, available_renditions
+
 register = template.Library()
 
 @register.filter
 def attr(obj, field_name):
     """Allows accessing object attributes dynamically in templates."""
     return getattr(obj, field_name)
+
+
+def _format_srcset(items):
+    return ", ".join(f"{url} {width}w" for width, url in items)
+
+
+@register.filter
+def srcset(field_file, fmt="jpeg"):
+    """Builds a srcset value from the renditions of an image in the given format."""
+    return _format_srcset(available_renditions(field_file).get(fmt, []))
+
+
+@register.simple_tag
+def responsive_image(field_file, alt="", sizes="100vw", css_class="", loading="lazy"):
+    """
+    Renders a <picture> with AVIF/WebP/JPEG sources for an image field,
+    falling back to a plain <img> of the original when no renditions exist.
+
+    Usage: {% responsive_image item.image alt=item.title sizes="(min-width: 768px) 33vw, 100vw" css_class="w-full" %}
+    """
+    if not field_file:
+        return ""
+
+    renditions = available_renditions(field_file)
+    if not renditions:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}" decoding="async">',
+            field_file.url, alt, css_class, loading,
+        )
+
+    sources = format_html_join(
+        "",
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (MIME_TYPES[fmt], _format_srcset(items), sizes)
+            for fmt, items in renditions.items()
+            if fmt != "jpeg"
+        ),
+    )
+    fallback = renditions.get("jpeg")
+    img_src = fallback[-1][1] if fallback else field_file.url
+    img_srcset = _format_srcset(fallback) if fallback else ""
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}" alt="{}" class="{}" loading="{}" decoding="async"></picture>',
+        sources, img_src, img_srcset, sizes, alt, css_class, loading,
+    )
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, name, models):
+        self.nodelist = nodelist
+        self.name = name
+        self.models = models
+
+    def render(self, context):
+        key = fragment_cache_key(
+            self.name.resolve(context),
+            [model.resolve(context) for model in self.models],
+        )
+        html = cache.get(key)
+        if html is None:
+            html = self.nodelist.render(context)
+            cache.set(key, html, settings.PAGE_CACHE_TIMEOUT)
+        return html
+
+
+@register.tag
+def fragment_cache(parser, token):
+    """
+    Caches the rendered block until a row of one of the named models
+    changes. Only wrap markup that depends on nothing but those models (no
+    request, user or CSRF token); context variables it reads are not
+    resolved on a hit, so they may be lazy.
+
+    Usage: {% fragment_cache "home-partners" "partner" %} ... {% endfragment_cache %}
+    """
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes a fragment name and at least one model name.")
+    nodelist = parser.parse(("endfragment_cache",))
+    parser.delete_first_token()
+    return FragmentCacheNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(bit) for bit in bits[2:]],
+    )
+
@@ -1,3 +1,665 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import timedelta
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.db.models import Count, Sum
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test.signals import template_rendered
+from PIL import Image
+from django.urls import reverse
+from django.utils import timezone
+
+from . import benchmarks, views
+from .caching import cache_public_page, conditional_public_page
+from .donation_import import import_donations
+from .gather import close_connections
+from .images import RENDITION_FORMATS, available_renditions, generate_renditions, normalize_image, rendition_name
+from .models import (
+    BlogPost,
+    ContactMessage,
+    Donation,
+    DonationRollup,
+    Event,
+    Gallery,
+    HeroImage,
+    OrganizationInfo,
+    Partner,
+    Pillar,
+    Project,
+    SiteStatistics,
+    VolunteerApplication,
+)
+from .pagination import encode_cursor, keyset_page
+from .search import search
+from .serving import serve_file
+
+
+@cache_public_page
+def _cached_view(request):
+    if "token" in request.GET:
+        get_token(request)
+    return HttpResponse(f"rendered {Pillar.objects.count()}")
+
+
+@conditional_public_page(Pillar)
+def _conditional_view(request):
+    return HttpResponse("page")
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class PageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def get(self, view, path="/page/", **headers):
+        return view(RequestFactory().get(path, headers=headers))
+
+    def test_miss_then_hit(self):
+        first = self.get(_cached_view)
+        self.assertEqual(first["X-Cache"], "MISS")
+        second = self.get(_cached_view)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+
+    def test_bypass(self):
+        self.assertEqual(_cached_view(RequestFactory().post("/page/"))["X-Cache"], "BYPASS")
+        # A rendered CSRF token is specific to the visitor.
+        self.assertEqual(self.get(_cached_view, "/page/?token=1")["X-Cache"], "BYPASS")
+        self.assertEqual(self.get(_cached_view, "/page/?token=1")["X-Cache"], "BYPASS")
+
+    def test_content_save_invalidates(self):
+        self.get(_cached_view)
+        Pillar.objects.create(title="Water", description="Water pillar")
+        response = self.get(_cached_view)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.content, b"rendered 1")
+
+    def test_private_save_keeps_the_cache(self):
+        self.get(_cached_view)
+        Donation.objects.create(donor_name="Donor", amount=10, method="mpesa")
+        SiteStatistics.rebuild()
+        self.assertEqual(self.get(_cached_view)["X-Cache"], "HIT")
+
+    def test_not_modified(self):
+        etag = self.get(_conditional_view)["ETag"]
+        self.assertEqual(self.get(_conditional_view, **{"If-None-Match": etag}).status_code, 304)
+
+        Pillar.objects.create(title="Water", description="Water pillar")
+        response = self.get(_conditional_view, **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Gallery.objects.bulk_create(
+            Gallery(title=f"Photo {i}", image=f"media/gallery/photo-{i}.jpg") for i in range(7)
+        )
+        # Ties on the sort key: three photos share one timestamp.
+        stamp = timezone.now() - timedelta(days=1)
+        tied = list(Gallery.objects.order_by("id").values_list("id", flat=True)[:3])
+        Gallery.objects.filter(id__in=tied).update(uploaded_at=stamp)
+
+    def pages(self, page_size):
+        ids, cursor = [], None
+        while True:
+            items, cursor = keyset_page(Gallery.objects.all(), cursor=cursor, page_size=page_size)
+            ids.append([item.id for item in items])
+            if cursor is None:
+                return ids
+
+    def test_pages_follow_a_stable_order_across_ties(self):
+        expected = list(Gallery.objects.order_by("-uploaded_at", "-id").values_list("id", flat=True))
+        for page_size in (1, 2, 3, 7):
+            with self.subTest(page_size=page_size):
+                pages = self.pages(page_size)
+                self.assertEqual([pk for page in pages for pk in page], expected)
+                self.assertTrue(all(len(page) <= page_size for page in pages))
+
+    def test_bad_cursors_start_from_the_first_page(self):
+        first, _ = keyset_page(Gallery.objects.all(), page_size=3)
+        for cursor in (
+            "not a cursor", "!!!", encode_cursor("yesterday", 1), encode_cursor(None, 1),
+            encode_cursor(timezone.now(), 10 ** 30), "WzEsMiwzXQ", "NQ",
+        ):
+            with self.subTest(cursor=cursor):
+                items, _ = keyset_page(Gallery.objects.all(), cursor=cursor, page_size=3)
+                self.assertEqual(items, first)
+                response = self.client.get(reverse("gallery_more"), {"cursor": cursor})
+                self.assertEqual(response.status_code, 200)
+
+
+class QueryPlanTests(TestCase):
+    """
+    Runs EXPLAIN on the hot public and dashboard queries against a seeded
+    dataset and checks each one is answered from its index (migration
+    0015) rather than a sequential scan.
+
+    Sequential scans are disabled for the duration of each test, so the
+    planner only falls back to one when no index can serve the query; the
+    result does not depend on how small the test dataset is.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        benchmarks.seed(pillars=20, projects=200, gallery=2000)
+        organization = OrganizationInfo.objects.get()
+        HeroImage.objects.bulk_create(
+            HeroImage(organization=organization, image=f"hero/benchmark-{i}.jpg", order=i)
+            for i in range(5)
+        )
+        # A selective status, as on the live site where most projects are
+        # completed: the planner then prefers the status index over
+        # filtering project_start_idx.
+        active = Project.objects.order_by("id").values_list("id", flat=True)[:5]
+        Project.objects.exclude(id__in=list(active)).update(status="completed")
+        Project.objects.filter(id__in=list(active)).update(status="active")
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Project._meta.db_table}")
+        cls.organization = organization
+        cls.pillar = Pillar.objects.first()
+        cls.project = Project.objects.first()
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn("Seq Scan", plan)
+
+    def test_project_list(self):
+        self.assertUsesIndex(Project.objects.order_by("-start_date", "-id")[:25], "project_start_idx")
+
+    def test_project_list_by_status(self):
+        queryset = Project.objects.filter(status="active").order_by("-start_date", "-id")[:25]
+        self.assertUsesIndex(queryset, "project_status_start_idx")
+
+    def test_event_list(self):
+        self.assertUsesIndex(Event.objects.order_by("-date", "-id")[:25], "event_date_idx")
+
+    def test_upcoming_events(self):
+        queryset = Event.objects.filter(is_upcoming=True).order_by("-date", "-id")[:25]
+        self.assertUsesIndex(queryset, "event_upcoming_date_idx")
+
+    def test_gallery_page(self):
+        self.assertUsesIndex(Gallery.objects.order_by("-uploaded_at", "-id")[:25], "gallery_uploaded_idx")
+
+    def test_gallery_by_project(self):
+        queryset = Gallery.objects.filter(related_project=self.project).order_by("-uploaded_at", "-id")[:6]
+        self.assertUsesIndex(queryset, "gallery_project_uploaded_idx")
+
+    def test_gallery_by_pillar(self):
+        queryset = Gallery.objects.filter(related_pillar=self.pillar).order_by("-uploaded_at", "-id")[:6]
+        self.assertUsesIndex(queryset, "gallery_pillar_uploaded_idx")
+
+    def test_donations_by_date(self):
+        since = timezone.now() - timedelta(days=30)
+        queryset = Donation.objects.filter(date__gte=since).order_by("-date", "-id")
+        self.assertUsesIndex(queryset, "donation_date_idx")
+
+    def test_hero_images(self):
+        self.assertUsesIndex(self.organization.hero_images.all(), "heroimage_org_order_idx")
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("staff", password="staff", is_staff=True)
+        Donation.objects.bulk_create(
+            Donation(donor_name=f"Donor {i}", amount=100 + i, method="mpesa") for i in range(3)
+        )
+        old = Donation.objects.create(donor_name="Old donor", amount=5, method="bank")
+        Donation.objects.filter(pk=old.pk).update(date=timezone.now() - timedelta(days=400))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.async_client.force_login(self.user)
+
+    def test_csv_stream_is_gzipped_and_date_filtered(self):
+        start = (timezone.localdate() - timedelta(days=30)).isoformat()
+        response = self.client.get(reverse("export", args=["donations"]), {"start": start}, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        lines = gzip.decompress(b"".join(response.streaming_content)).decode().splitlines()
+        self.assertEqual(lines[0], "id,donor_name,amount,method,transaction_id,date")
+        self.assertEqual(len(lines), 4)
+        self.assertNotIn("Old donor", "".join(lines))
+
+    async def test_asgi_stream_is_async(self):
+        response = await self.async_client.get(reverse("export", args=["donations"]), {"format": "jsonl"})
+        self.assertTrue(response.is_async)
+        lines = b"".join([chunk async for chunk in response.streaming_content]).decode().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(json.loads(lines[0])["donor_name"], "Donor 0")
+
+    def test_unknown_export(self):
+        self.assertEqual(self.client.get(reverse("export", args=["users"])).status_code, 404)
+
+
+class CrudListTests(TestCase):
+    def test_choice_columns_show_labels(self):
+        self.client.force_login(User.objects.create_user("staff", password="staff", is_staff=True))
+        Partner.objects.create(name="County office", partner_type="government")
+        response = self.client.get(reverse("partner_list"))
+        self.assertEqual(response.context["rows"][0]["cells"][:2], ["County office", "Government"])
+
+
+class SiteStatisticsTests(TestCase):
+    def assertCountersMatch(self):
+        stats = SiteStatistics.load()
+        donations = Donation.objects.aggregate(count=Count("id"), total=Sum("amount"))
+        self.assertEqual(
+            (stats.events_count, stats.partners_count, stats.volunteers_count, stats.donations_count, stats.donations_total),
+            (
+                Event.objects.count(), Partner.objects.count(), VolunteerApplication.objects.count(),
+                donations["count"], donations["total"] or 0,
+            ),
+        )
+
+    def test_signals_keep_counters_current(self):
+        SiteStatistics.rebuild()
+        event = Event.objects.create(title="Clean-up", description="D", date=timezone.localdate(), location="Kakamega")
+        Event.objects.create(title="Planting", description="D", date=timezone.localdate(), location="Kakamega")
+        Partner.objects.create(name="County office", partner_type="government")
+        VolunteerApplication.objects.create(name="Amina", email="a@example.com", phone="0700000000", message="Hi")
+        donation = Donation.objects.create(donor_name="A", amount=100, method="mpesa")
+        Donation.objects.create(donor_name="B", amount=40, method="bank")
+        self.assertCountersMatch()
+
+        donation.amount = 150
+        donation.save()
+        event.delete()
+        Donation.objects.filter(donor_name="B").delete()
+        Partner.objects.all().delete()
+        self.assertCountersMatch()
+
+    def test_rebuild_recovers_from_bulk_writes(self):
+        SiteStatistics.rebuild()
+        # bulk_create sends no signals, so only rebuild() can catch up.
+        Donation.objects.bulk_create(Donation(donor_name=f"D{i}", amount=10, method="mpesa") for i in range(3))
+        self.assertEqual(SiteStatistics.load().donations_count, 0)
+        SiteStatistics.rebuild()
+        self.assertCountersMatch()
+
+
+class DonationRollupTests(TestCase):
+    def rollup(self):
+        return sorted(
+            DonationRollup.objects.exclude(donations_count=0)
+            .values_list("period", "bucket", "method", "donations_count", "donations_total")
+        )
+
+    def test_incremental_updates_match_rebuild(self):
+        first = Donation.objects.create(donor_name="A", amount=100, method="mpesa")
+        second = Donation.objects.create(donor_name="B", amount=50, method="bank")
+        Donation.objects.create(donor_name="C", amount=25, method="mpesa")
+        first.amount = 120
+        first.method = "paypal"
+        first.save()
+        second.delete()
+
+        incremental = self.rollup()
+        DonationRollup.rebuild()
+        self.assertEqual(incremental, self.rollup())
+        self.assertEqual(
+            sum(total for period, _, _, _, total in incremental if period == "month"), 145,
+        )
+
+
+class DonationImportTests(TestCase):
+    def test_import_skips_known_transactions(self):
+        Donation.objects.create(donor_name="Existing", amount=10, method="mpesa", transaction_id="QX1")
+        statement = io.StringIO(
+            "donor_name,amount,transaction_id,date\n"
+            "Existing,10,QX1,2024-05-01\n"
+            "New donor,\"1,250.00\",QX2,2024-05-02 10:30\n"
+            "Repeated,20,QX3,2024-05-03\n"
+            "Repeated,20,QX3,2024-05-03\n"
+            "Broken,abc,QX4,2024-05-04\n"
+        )
+        result = import_donations(statement, default_method="mpesa", batch_size=2)
+
+        self.assertEqual(
+            (result["read"], result["inserted"], result["duplicates"], result["rejected"]), (5, 2, 2, 1),
+        )
+        self.assertEqual(Donation.objects.count(), 3)
+        self.assertEqual(SiteStatistics.load().donations_total, 1280)
+        month = DonationRollup.objects.get(period="month", bucket="2024-05-01", method="mpesa")
+        self.assertEqual((month.donations_count, month.donations_total), (2, 1270))
+
+
+class APITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        pillar = Pillar.objects.create(title="Water", description="Water pillar")
+        Project.objects.bulk_create(
+            Project(
+                title=f"Project {i}", pillar=pillar, description="Long description", location="Kenya",
+                start_date=timezone.localdate() - timedelta(days=i), status="active",
+            )
+            for i in range(5)
+        )
+
+    def test_field_selection_and_cursor_pagination(self):
+        response = self.client.get(reverse("api_list", args=["projects"]), {"fields": "title,pillar_title", "limit": 3})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["data"][0], {"id": body["data"][0]["id"], "title": "Project 0", "pillar_title": "Water"})
+        self.assertEqual(len(body["data"]), 3)
+
+        second = self.client.get(body["next"]).json()
+        self.assertEqual([item["title"] for item in second["data"]], ["Project 3", "Project 4"])
+        self.assertIsNone(second["next"])
+
+    def test_etag_revalidation(self):
+        url = reverse("api_list", args=["projects"])
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_unknown_field(self):
+        response = self.client.get(reverse("api_list", args=["projects"]), {"fields": "secret"})
+        self.assertEqual(response.status_code, 400)
+
+
+class ProjectPagesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        OrganizationInfo.objects.create(
+            name="BECC", vision="V", mission="M", goal="G", motto="M", slogan="S", about="A",
+            contact_email="info@example.com", phone="0700000000", address="Nairobi",
+        )
+        pillar = Pillar.objects.create(title="Water", description="Water pillar")
+        cls.project = Project.objects.create(
+            title="Boreholes", pillar=pillar, short_description="Clean water for schools",
+            description="Full project write-up", impact=["12 boreholes drilled"],
+            start_date=timezone.localdate(), location="Kitui", status="active",
+        )
+
+    def test_listing_leaves_details_to_the_fragment(self):
+        listing = self.client.get(reverse("projects"))
+        self.assertContains(listing, "Clean water for schools")
+        self.assertNotContains(listing, "Full project write-up")
+        self.assertContains(listing, reverse("project_fragment", args=[self.project.pk]))
+
+        fragment = self.client.get(reverse("project_fragment", args=[self.project.pk]))
+        self.assertContains(fragment, "Full project write-up")
+        self.assertContains(fragment, "12 boreholes drilled")
+
+    def test_detail_page(self):
+        self.assertContains(self.client.get(reverse("project_detail", args=[self.project.pk])), "Full project write-up")
+        self.assertEqual(self.client.get(reverse("project_detail", args=[self.project.pk + 1])).status_code, 404)
+
+
+class BlogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        OrganizationInfo.objects.create(
+            name="BECC", vision="V", mission="M", goal="G", motto="M", slogan="S", about="A",
+            contact_email="info@example.com", phone="0700000000", address="Nairobi",
+        )
+        cls.post = BlogPost.objects.create(
+            title="Tree planting day", slug="tree-planting-day", category="News", published=True,
+            content="## Planting\n\nWe planted *500* trees. <script>alert(1)</script>\n\n" + "word " * 450,
+        )
+        BlogPost.objects.create(title="Draft", slug="draft", content="Not yet", published=False)
+
+    def test_content_is_rendered_and_sanitized_on_save(self):
+        self.assertIn("<h2>Planting</h2>", self.post.content_html)
+        self.assertIn("<em>500</em>", self.post.content_html)
+        self.assertNotIn("script", self.post.content_html)
+        self.assertEqual(self.post.reading_time, 3)
+        self.assertTrue(self.post.excerpt.startswith("Planting We planted 500 trees."))
+
+    def test_list_and_detail_show_published_posts_only(self):
+        listing = self.client.get(reverse("blog"), {"category": "News"})
+        self.assertContains(listing, "Tree planting day")
+        self.assertNotContains(listing, "Draft")
+        self.assertContains(self.client.get(reverse("blog_post", args=["tree-planting-day"])), "<h2>Planting</h2>", html=True)
+        self.assertEqual(self.client.get(reverse("blog_post", args=["draft"])).status_code, 404)
+
+    def test_search_links_to_the_post(self):
+        results, _ = search("planting")
+        self.assertEqual([result["url"] for result in results], [reverse("blog_post", args=["tree-planting-day"])])
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        pillar = Pillar.objects.create(title="Energy", description="Clean energy pillar")
+        cls.project = Project.objects.create(
+            title="Solar kiosks", pillar=pillar, description="Charging points for the market",
+            start_date=timezone.localdate(), location="Kakamega", status="active",
+        )
+        cls.event = Event.objects.create(
+            title="Market day", description="Demonstrating solar lamps & lanterns to traders",
+            date=timezone.localdate(), location="Kakamega",
+        )
+        for i in range(3):
+            Gallery.objects.create(title=f"Panel {i}", description="Installing a solar panel", image=f"media/gallery/panel-{i}.jpg")
+
+    def test_title_matches_rank_above_description_matches(self):
+        results, has_next = search("solar")
+        self.assertFalse(has_next)
+        self.assertEqual(len(results), 5)
+        self.assertEqual((results[0]["kind"], results[0]["id"]), ("project", self.project.pk))
+        self.assertEqual(results[0]["url"], reverse("project_detail", args=[self.project.pk]))
+        self.assertEqual(
+            [result["rank"] for result in results], sorted((result["rank"] for result in results), reverse=True),
+        )
+
+    def test_pagination(self):
+        first, has_next = search("solar", offset=0, limit=3)
+        self.assertTrue(has_next)
+        second, has_next = search("solar", offset=3, limit=3)
+        self.assertFalse(has_next)
+        self.assertEqual(len(first) + len(second), 5)
+        keys = [(result["kind"], result["id"]) for result in first + second]
+        self.assertEqual(len(set(keys)), 5)
+
+    def test_headline_is_escaped_and_highlighted(self):
+        results, _ = search("lamps")
+        self.assertEqual(results[0]["id"], self.event.pk)
+        self.assertIn("<mark>lamps</mark>", results[0]["excerpt"])
+        self.assertIn("&amp; lanterns", results[0]["excerpt"])
+
+
+class ContactTests(TestCase):
+    def test_post_requires_the_fetched_csrf_token(self):
+        client = Client(enforce_csrf_checks=True)
+        message = {"name": "Amina", "email": "amina@example.com", "subject": "Hello", "message": "Hi"}
+        self.assertEqual(client.post(reverse("contact"), message).status_code, 403)
+
+        token = client.get(reverse("contact_token")).json()["token"]
+        response = client.post(reverse("contact"), {**message, "csrfmiddlewaretoken": token})
+        self.assertRedirects(response, reverse("contact"), fetch_redirect_response=False)
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+class AsyncViewTests(TransactionTestCase):
+    """
+    The async public views (ASYNC_VIEWS) must render the same context as
+    their sync counterparts. gather_queries runs on other threads with their
+    own connections, which only see committed data, hence
+    TransactionTestCase.
+    """
+
+    def setUp(self):
+        benchmarks.seed(pillars=3, projects=5, gallery=10)
+        Partner.objects.create(name="Partner", partner_type="ngo")
+        # The worker threads keep their connections; none may outlive the
+        # test database.
+        self.addCleanup(close_connections)
+
+    def context(self, view, path):
+        contexts = []
+
+        def capture(sender, context, **kwargs):
+            contexts.append(context.flatten())
+
+        request = RequestFactory().get(path)
+        template_rendered.connect(capture)
+        try:
+            response = async_to_sync(view)(request) if asyncio.iscoroutinefunction(view) else view(request)
+        finally:
+            template_rendered.disconnect(capture)
+        self.assertEqual(response.status_code, 200)
+        return contexts[0]
+
+    def assertSameContext(self, sync_view, async_view, keys, path="/"):
+        sync_context = self.context(sync_view, path)
+        async_context = self.context(async_view, path)
+        for key in keys:
+            with self.subTest(view=async_view.__name__, key=key):
+                sync_value, async_value = sync_context[key], async_context[key]
+                if key in ("pillars", "partners"):
+                    sync_value = list(sync_value)
+                self.assertEqual(sync_value, async_value)
+
+    def test_home(self):
+        self.assertSameContext(views.home, views.home_async, ["pillars", "projects", "partners", "org_info"])
+
+    def test_pillars(self):
+        self.assertSameContext(views.pillars, views.pillars_async, ["pillars", "org_info"], "/pillars/")
+
+    def test_projects(self):
+        self.assertSameContext(views.projects, views.projects_async, ["projects", "org_info"], "/projects/")
+
+    def test_gallery(self):
+        project = Project.objects.first()
+        self.assertSameContext(
+            views.gallery, views.gallery_async,
+            ["gallery_images", "next_cursor", "page_title", "org_info"], f"/gallery/?project={project.pk}",
+        )
+
+
+@override_settings(FILES_ACCEL_REDIRECT_PREFIX="")
+class ServingTests(SimpleTestCase):
+    BODY = b"0123456789" * 10
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        for name, body in (("app.js", self.BODY), ("app.js.gz", b"gz"), ("app.js.br", b"br")):
+            with open(os.path.join(self.root, name), "wb") as fh:
+                fh.write(body)
+
+    def serve(self, kind="static", **headers):
+        request = RequestFactory().get(f"/{kind}/app.js", headers=headers)
+        return serve_file(request, "app.js", document_root=self.root, kind=kind)
+
+    def body(self, response):
+        content = b"".join(response.streaming_content)
+        response.close()
+        return content
+
+    def test_range(self):
+        response = self.serve(kind="media", Range="bytes=10-19")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 10-19/{len(self.BODY)}")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(self.body(response), self.BODY[10:20])
+
+        suffix = self.serve(kind="media", Range="bytes=-5")
+        self.assertEqual(suffix["Content-Range"], "bytes 95-99/100")
+        self.assertEqual(self.body(suffix), self.BODY[-5:])
+
+    def test_unsatisfiable_range(self):
+        response = self.serve(kind="media", Range="bytes=500-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */100")
+
+    def test_if_range_mismatch_sends_the_whole_file(self):
+        response = self.serve(kind="media", Range="bytes=10-19", **{"If-Range": '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), self.BODY)
+
+    def test_precompressed_sibling(self):
+        for accept, encoding, body in (("gzip, br", "br", b"br"), ("gzip", "gzip", b"gz"), ("", None, self.BODY)):
+            with self.subTest(accept=accept):
+                response = self.serve(**{"Accept-Encoding": accept})
+                self.assertEqual(response.get("Content-Encoding"), encoding)
+                self.assertIn("Accept-Encoding", response["Vary"])
+                self.assertEqual(self.body(response), body)
+
+    @override_settings(FILES_ACCEL_REDIRECT_PREFIX="/protected/")
+    def test_accel_redirect(self):
+        response = self.serve(kind="media")
+        self.assertEqual(response["X-Accel-Redirect"], "/protected/media/app.js")
+        self.assertEqual(response.content, b"")
+        self.assertIn("ETag", response)
+
+
+class ImageProcessingTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        media = override_settings(MEDIA_ROOT=directory.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def upload(self, name, image, **options):
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", **options)
+        return Gallery(image=default_storage.save(name, ContentFile(buffer.getvalue()))).image
+
+    def open(self, name):
+        with default_storage.open(name) as fh:
+            image = Image.open(fh)
+            image.load()
+        return image
+
+    def test_metadata_is_stripped_and_orientation_applied(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotate 90 degrees clockwise to display
+        exif[0x010F] = "Camera maker"
+        field_file = self.upload(
+            "media/gallery/photo.jpg", Image.new("RGB", (200, 100), "green"),
+            exif=exif, xmp=b"<x:xmpmeta xmlns:x='adobe:ns:meta/'></x:xmpmeta>",
+        )
+        self.assertIn("xmp", self.open(field_file.name).info)
+
+        name, original_bytes, stored_bytes, width, height = normalize_image(field_file)
+        self.assertNotEqual(name, field_file.name)
+        self.assertEqual((width, height), (100, 200))
+        normalized = self.open(name)
+        self.assertEqual(normalized.size, (100, 200))
+        self.assertEqual(dict(normalized.getexif()), {})
+        self.assertNotIn("xmp", normalized.info)
+
+    @override_settings(IMAGE_MAX_DIMENSION=500)
+    def test_longest_edge_is_capped(self):
+        field_file = self.upload("media/gallery/wide.jpg", Image.new("RGB", (1000, 400), "green"))
+        name, *_, width, height = normalize_image(field_file)
+        self.assertEqual((width, height), (500, 200))
+        self.assertEqual(self.open(name).size, (500, 200))
+
+    def test_renditions_per_format_and_width(self):
+        field_file = self.upload("media/gallery/field.jpg", Image.new("RGB", (1200, 600), "green"))
+        # Buckets below the original, plus 1600 rendered at the original 1200px.
+        self.assertEqual(generate_renditions(field_file), [320, 640, 1024, 1600])
+
+        renditions = available_renditions(field_file)
+        self.assertEqual(list(renditions), RENDITION_FORMATS)
+        for fmt in RENDITION_FORMATS:
+            self.assertEqual([width for width, _ in renditions[fmt]], [320, 640, 1024, 1600])
+            for width in (320, 640, 1024, 1600):
+                image = self.open(rendition_name(field_file.name, width, fmt))
+                self.assertEqual(image.format, fmt.upper())
+                self.assertEqual(image.width, min(width, 1200))
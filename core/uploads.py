@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import transaction
+from PIL import Image
+
+from .background import run_in_background
+from .caching import bump_content_version, bump_model_versions
+from .images import process_upload
+from .models import Gallery
+from .search import update_search_vector
+
+# Threads used to verify and store the files of one bulk upload.
+BULK_UPLOAD_WORKERS = 4
+
+
+def _store_image(upload):
+    """
+    Verifies that ``upload`` is a decodable image and writes it to storage.
+    Returns (stored_name, None) or (None, error message).
+    """
+    try:
+        with Image.open(upload) as image:
+            image.verify()
+    except Exception:
+        return None, f"{upload.name}: not a valid image."
+
+    upload.seek(0)
+    field = Gallery._meta.get_field("image")
+    name = field.generate_filename(None, upload.name)
+    return field.storage.save(name, upload, max_length=field.max_length), None
+
+
+def bulk_create_gallery(uploads, title="", description="", related_pillar=None, related_project=None, related_event=None):
+    """
+    Stores many uploaded images in parallel and inserts their Gallery rows
+    with a single bulk_create. Returns (created, errors).
+
+    bulk_create skips post_save, so the work the signals would do (search
+    vectors, page cache invalidation and rendition building) is done here.
+    """
+    with ThreadPoolExecutor(max_workers=BULK_UPLOAD_WORKERS) as pool:
+        results = list(pool.map(_store_image, uploads))
+
+    stored = [(upload, name) for upload, (name, _) in zip(uploads, results) if name]
+    errors = [error for _, error in results if error]
+    if not stored:
+        return [], errors
+
+    rows = [
+        Gallery(
+            title=(f"{title} {index}" if title else upload.name.rsplit(".", 1)[0])[:200],
+            description=description,
+            image=name,
+            related_pillar=related_pillar,
+            related_project=related_project,
+            related_event=related_event,
+        )
+        for index, (upload, name) in enumerate(stored, start=1)
+    ]
+
+    storage = Gallery._meta.get_field("image").storage
+    try:
+        with transaction.atomic():
+            created = Gallery.objects.bulk_create(rows)
+            update_search_vector(Gallery, [gallery.pk for gallery in created])
+    except Exception:
+        for _, name in stored:
+            storage.delete(name)
+        raise
+
+    bump_content_version()
+    bump_model_versions(Gallery)
+    for gallery in created:
+        run_in_background(process_upload, Gallery, gallery.pk, "image")
+    return created, errors
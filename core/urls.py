@@ -1,5 +1,12 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import api, views
+
+# Under an ASGI server the public pages can run their queries concurrently.
+if settings.ASYNC_VIEWS:
+    home, pillars, projects, gallery = views.home_async, views.pillars_async, views.projects_async, views.gallery_async
+else:
+    home, pillars, projects, gallery = views.home, views.pillars, views.projects, views.gallery
 
 urlpatterns = [
     # authentication
@@ -7,6 +14,9 @@ urlpatterns = [
     path("logout/", views.CustomLogoutView.as_view(), name="logout"),
 
     path("dashboard/", views.dashboard, name="dashboard"),
+    path("dashboard/metrics/", views.metrics, name="metrics"),
+    path("dashboard/analytics/donations/", views.donation_analytics, name="donation_analytics"),
+    path("dashboard/export/<slug:name>/", views.export, name="export"),
     
     # Organization Info
     path("dashboard/settings/", views.general_info_view, name="general_info"),
@@ -34,17 +44,27 @@ urlpatterns = [
     # Gallery CRUD
     path('dashboard/gallery/', views.gallery_list, name='gallery_list'),
     path('dashboard/gallery/add/', views.gallery_create, name='gallery_create'),
+    path('dashboard/gallery/bulk/', views.gallery_bulk_upload, name='gallery_bulk_upload'),
     path('dashboard/gallery/edit/<int:pk>/', views.gallery_update, name='gallery_update'),
     path('dashboard/gallery/delete/<int:pk>/', views.gallery_delete, name='gallery_delete'),
     # Public website routes
-    path("", views.home, name="home"),
-    path("pillars/", views.pillars, name="pillars"),
-    path("projects/", views.projects, name="projects"),
+    path("", home, name="home"),
+    path("pillars/", pillars, name="pillars"),
+    path("projects/", projects, name="projects"),
+    path("projects/<int:pk>/", views.project_detail, name="project_detail"),
+    path("projects/<int:pk>/fragment/", views.project_fragment, name="project_fragment"),
+    path("blog/", views.blog, name="blog"),
+    path("blog/<slug:slug>/", views.blog_post, name="blog_post"),
     # path("gallery/", views.gallery_page, name="gallery_page"),
     path("contact/", views.contact, name="contact"),
+    path("contact/token/", views.contact_token, name="contact_token"),
     path("about/", views.about, name="about"),
-    path("contact/", views.contact, name="contact"),
-    path("gallery/", views.gallery, name="gallery"),
+    path("gallery/", gallery, name="gallery"),
+    path("gallery/more/", views.gallery_more, name="gallery_more"),
+    path("search/", views.search, name="search"),
+    # Read-only JSON API
+    path(f"api/{api.API_VERSION}/<slug:resource>/", views.api_list, name="api_list"),
+    path(f"api/{api.API_VERSION}/<slug:resource>/<int:pk>/", views.api_detail, name="api_detail"),
 
 
 
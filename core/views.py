@@ -1,15 +1,37 @@
-from django.contrib.auth.decorators import login_required
+from asgiref.sync import sync_to_async
+from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.views import LoginView, LogoutView
 from django.shortcuts import render, redirect, get_object_or_404
-from .models import Project, Event, Partner, VolunteerApplication, Donation, Pillar, Gallery, ContactMessage, OrganizationInfo, HeroImage
-from django.db import models
+from .models import BlogPost, Project, Event, Partner, VolunteerApplication, Donation, Pillar, Gallery, ContactMessage, OrganizationInfo, HeroImage, SiteStatistics, ProcessedImage, DonationRollup, TeamMember
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, Left, NullIf
 from django.contrib import messages
-from .forms import ProjectForm, PillarForm, EventForm, PartnerForm, GalleryForm, PillarGalleryFormSet, ProjectGalleryFormSet, OrganizationInfoForm, HeroImageFormSet
+from .forms import ContactForm, ProjectForm, PillarForm, EventForm, PartnerForm, GalleryForm, GalleryBulkUploadForm, PillarGalleryFormSet, ProjectGalleryFormSet, OrganizationInfoForm, HeroImageFormSet
 from django.urls import reverse, reverse_lazy
 from datetime import datetime
 from django.core.mail import send_mail
 from django.conf import settings
 from django.shortcuts import render
+from django.http import JsonResponse
+from django.template.loader import render_to_string
+from django.utils.functional import SimpleLazyObject
+from django.middleware.csrf import get_token
+from django.views.decorators.cache import never_cache
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import conditional_page, require_safe
+from . import api
+from .analytics import chart_bars, chart_legend, donation_series
+from .caching import cache_public_page, conditional_public_page
+from .context_processors import get_organization_snapshot
+from .crud import build_list_context
+from .exports import EXPORTS, export_response
+from .gather import gather_queries
+from .pagination import keyset_page
+from .outbox import enqueue_contact_notification
+from .metrics import WINDOW_SIZE as METRICS_WINDOW_SIZE, store as metrics_store
+from .prefetch import prefetch_top_related
+from .search import search as run_search
+from .uploads import bulk_create_gallery
 
 class CustomLoginView(LoginView):
     template_name = "core/auth/login.html"
@@ -22,59 +44,222 @@ class CustomLoginView(LoginView):
 class CustomLogoutView(LogoutView):
     next_page = reverse_lazy("login")
 
-def projects(request):
-    projects = Project.objects.all().select_related('pillar').prefetch_related('gallery_set')
-
-    formatted_projects = [
+# Characters of description shown on a card when there is no short_description.
+PROJECT_SUMMARY_LENGTH = 200
+# Newest gallery images shown on a project detail page.
+PROJECT_GALLERY_SIZE = 8
+
+
+def _project_cards():
+    # Only what the cards show; description, impact and gallery are loaded
+    # per project by project_detail / project_fragment.
+    projects = (
+        Project.objects.select_related('pillar')
+        .only('id', 'title', 'image', 'status', 'pillar__title')
+        .annotate(summary=Coalesce(
+            NullIf('short_description', models.Value('')),
+            Left('description', PROJECT_SUMMARY_LENGTH),
+            output_field=models.TextField(),
+        ))
+        .order_by('-start_date', '-id')
+    )
+
+    return [
         {
             "id": p.id,
             "title": p.title,
             "category": p.pillar.title if p.pillar else "Uncategorized",
-            "image": p.image.url if p.image else "/static/images/placeholder.jpg",
-            "description": p.description,
-            "impact": p.impact,  # Already a list!
+            "image": p.image,
+            "summary": p.summary,
             "status": p.get_status_display(),
-            "gallery": p.gallery_set.all(),
         }
         for p in projects
     ]
 
+
+@conditional_public_page(Project, Pillar)
+@cache_public_page
+def projects(request):
     return render(request, "public/projects.html", {
+        "projects": _project_cards()
+    })
+
+
+@conditional_public_page(Project, Pillar)
+@cache_public_page
+async def projects_async(request):
+    formatted_projects, _ = await gather_queries(_project_cards, get_organization_snapshot)
+    return await sync_to_async(render)(request, "public/projects.html", {
         "projects": formatted_projects
     })
 
 
-def gallery(request):
-    project_id = request.GET.get('project')
-    page_title = "Gallery"
-    page_description = "Visual stories of our environmental conservation work and community impact."
-    
+def _project_detail_context(pk):
+    project = get_object_or_404(Project.objects.select_related('pillar'), pk=pk)
+    gallery_images = list(
+        Gallery.objects.filter(related_project=project).order_by('-uploaded_at', '-id')[:PROJECT_GALLERY_SIZE]
+    )
+    return {"project": project, "gallery_images": gallery_images}
+
+
+@conditional_public_page(Project, Pillar, Gallery)
+@cache_public_page
+def project_detail(request, pk):
+    return render(request, "public/project_detail.html", _project_detail_context(pk))
+
+
+@conditional_public_page(Project, Pillar, Gallery)
+@cache_public_page
+def project_fragment(request, pk):
+    """Description, impact and gallery of one project, loaded into its card on demand."""
+    return render(request, "public/components/_project_detail.html", _project_detail_context(pk))
+
+
+GALLERY_PAGE_SIZE = 24
+
+
+def _gallery_queryset(project_id=None):
+    gallery_images = Gallery.objects.select_related('related_project')
     if project_id:
-        project = get_object_or_404(Project, pk=project_id)
-        gallery_images = Gallery.objects.filter(related_project=project).order_by('-uploaded_at')
-        page_title = f"{project.title}"
-        page_description = f"Gallery photos for {project.title}"
-    else:
-        gallery_images = Gallery.objects.all().order_by('-uploaded_at')
+        gallery_images = gallery_images.filter(related_project_id=project_id)
+    return gallery_images
 
-    return render(request, "public/gallery.html", {
+
+def _gallery_context(project, gallery_page, project_id):
+    gallery_images, next_cursor = gallery_page
+    return {
         "gallery_images": gallery_images,
-        "page_title": page_title,
-        "page_description": page_description
+        "next_cursor": next_cursor,
+        "project_id": project_id,
+        "page_title": project.title if project else "Gallery",
+        "page_description": (
+            f"Gallery photos for {project.title}" if project
+            else "Visual stories of our environmental conservation work and community impact."
+        ),
+    }
+
+
+@conditional_public_page(Gallery, Project)
+@cache_public_page
+def gallery(request):
+    project_id = request.GET.get('project')
+    project = get_object_or_404(Project, pk=project_id) if project_id else None
+    gallery_page = keyset_page(_gallery_queryset(project_id), page_size=GALLERY_PAGE_SIZE)
+    return render(request, "public/gallery.html", _gallery_context(project, gallery_page, project_id))
+
+
+@conditional_public_page(Gallery, Project)
+@cache_public_page
+async def gallery_async(request):
+    project_id = request.GET.get('project')
+    project, gallery_page, _ = await gather_queries(
+        lambda: get_object_or_404(Project, pk=project_id) if project_id else None,
+        lambda: keyset_page(_gallery_queryset(project_id), page_size=GALLERY_PAGE_SIZE),
+        get_organization_snapshot,
+    )
+    return await sync_to_async(render)(request, "public/gallery.html", _gallery_context(project, gallery_page, project_id))
+
+
+@cache_public_page
+def gallery_more(request):
+    """
+    JSON endpoint for infinite scroll: the next batch of gallery cards as an
+    HTML fragment plus the cursor for the batch after it.
+    """
+    project_id = request.GET.get('project')
+    if project_id and not project_id.isdigit():
+        return JsonResponse({"error": "Invalid project."}, status=400)
+
+    gallery_images, next_cursor = keyset_page(
+        _gallery_queryset(project_id),
+        cursor=request.GET.get('cursor'),
+        page_size=GALLERY_PAGE_SIZE,
+    )
+    html = render_to_string("public/components/_gallery_items.html", {"gallery_images": gallery_images}, request=request)
+    return JsonResponse({"html": html, "next_cursor": next_cursor})
+
+
+BLOG_PAGE_SIZE = 10
+
+
+@conditional_public_page(BlogPost, TeamMember)
+@cache_public_page
+def blog(request):
+    category = request.GET.get('category', '')
+    posts = (
+        BlogPost.objects.filter(published=True)
+        .select_related('author')
+        .only('id', 'title', 'slug', 'image', 'category', 'excerpt', 'reading_time', 'created_at', 'author__name')
+    )
+    if category:
+        posts = posts.filter(category=category)
+    posts, next_cursor = keyset_page(posts, cursor=request.GET.get('cursor'), page_size=BLOG_PAGE_SIZE, field='created_at')
+    categories = (
+        BlogPost.objects.filter(published=True).exclude(category='')
+        .order_by('category').values_list('category', flat=True).distinct()
+    )
+    return render(request, "public/blog.html", {
+        "posts": posts,
+        "next_cursor": next_cursor,
+        "category": category,
+        "categories": list(categories),
     })
 
 
-def contact(request):
-    if request.method == "POST":
-        # Example: you can integrate email sending or save to DB
-        name = request.POST.get("name")
-        email = request.POST.get("email")
-        subject = request.POST.get("subject")
-        message = request.POST.get("message")
-        print(name, email, subject, message)  # debug log
-    return render(request, "public/contact.html")
+@conditional_public_page(BlogPost, TeamMember)
+@cache_public_page
+def blog_post(request, slug):
+    post = get_object_or_404(
+        BlogPost.objects.select_related('author').defer('content', 'search_vector'),
+        slug=slug, published=True,
+    )
+    return render(request, "public/blog_post.html", {"post": post})
+
 
+# Read-only JSON API. conditional_page adds a body ETag and answers
+# If-None-Match with 304; gzip_page compresses for clients that accept it.
+@gzip_page
+@require_safe
+@conditional_page
+@cache_public_page
+def api_list(request, resource):
+    return api.list_response(request, resource)
 
+
+@gzip_page
+@require_safe
+@conditional_page
+@cache_public_page
+def api_detail(request, resource, pk):
+    return api.detail_response(request, resource, pk)
+
+
+def contact(request):
+    form = ContactForm()
+    if request.method == "POST":
+        form = ContactForm(request.POST)
+        if form.is_valid():
+            # Stored and queued in one transaction; `manage.py send_outbox`
+            # emails the notification, so SMTP never slows this request.
+            with transaction.atomic():
+                contact_message = form.save()
+                enqueue_contact_notification(contact_message)
+            messages.success(request, "Thank you! Your message has been sent.")
+            return redirect("contact")
+    return render(request, "public/contact.html", {"form": form})
+
+
+@never_cache
+@require_safe
+def contact_token(request):
+    """
+    CSRF token for the contact form embedded in cached pages (home), which
+    cannot carry a per-visitor token themselves. Also sets the CSRF cookie.
+    """
+    return JsonResponse({"token": get_token(request)})
+
+
+@cache_public_page
 def about(request):
     core_values = [
         {
@@ -105,93 +290,159 @@ def about(request):
 
     return render(request, "public/about.html", context)
 
-def pillars(request):
-
-    db_pillars = Pillar.objects.all()
-    pillars = []
-
-    for i, pillar in enumerate(db_pillars):
-        pillars.append({
+def _pillar_cards():
+    db_pillars = prefetch_top_related(
+        Pillar.objects.all(), Gallery.objects.all(), 'related_pillar', 4, to_attr='top_gallery_images',
+    )
+    return [
+        {
+            "id": pillar.id,
             "title": pillar.title,
             "description": pillar.description or pillar.short_description,
             "activities": pillar.activities,
             "icon": pillar.icon,
-            "gallery_images": pillar.gallery_images.all()[:4], # Limit to 4 images
-        })
-    return render(request, "public/pillars.html", {"pillars": pillars})
+            "gallery_images": pillar.top_gallery_images, # Limit to 4 images
+        }
+        for pillar in db_pillars
+    ]
 
 
-def home(request):
-    gradients = [
-        "bg-gradient-to-br from-green-400 to-green-700",
-        "bg-gradient-to-br from-yellow-400 to-yellow-600",
-        "bg-gradient-to-br from-sky-400 to-sky-600",
-        "bg-gradient-to-br from-emerald-400 to-green-700",
-    ]
+@conditional_public_page(Pillar, Gallery)
+@cache_public_page
+def pillars(request):
+    return render(request, "public/pillars.html", {"pillars": _pillar_cards()})
 
-    db_pillars = Pillar.objects.all()
-    pillars = []
 
-    for i, pillar in enumerate(db_pillars):
-        gradient = gradients[i % len(gradients)]
-        
-        # Fetch related gallery images (Limit to 2 for home page)
-        # Using reversed relationship 'gallery_images'
-        gallery_images = pillar.gallery_images.all()[:2] 
+@conditional_public_page(Pillar, Gallery)
+@cache_public_page
+async def pillars_async(request):
+    pillars, _ = await gather_queries(_pillar_cards, get_organization_snapshot)
+    return await sync_to_async(render)(request, "public/pillars.html", {"pillars": pillars})
+
+
+HOME_GRADIENTS = [
+    "bg-gradient-to-br from-green-400 to-green-700",
+    "bg-gradient-to-br from-yellow-400 to-yellow-600",
+    "bg-gradient-to-br from-sky-400 to-sky-600",
+    "bg-gradient-to-br from-emerald-400 to-green-700",
+]
 
-        pillars.append({
+
+def _home_pillars():
+    # Related gallery images (limit 2 per pillar) are fetched in one windowed query
+    db_pillars = prefetch_top_related(
+        Pillar.objects.all(), Gallery.objects.all(), 'related_pillar', 2, to_attr='top_gallery_images',
+    )
+    return [
+        {
             "title": pillar.title,
             "description": pillar.short_description or pillar.description,
             "activities": pillar.activities[:3],
             "icon": pillar.icon,
-            "gradient": gradient,
-            "gallery_images": gallery_images,
-        })
-    projects = Project.objects.all().select_related('pillar')[:3]
+            "gradient": HOME_GRADIENTS[i % len(HOME_GRADIENTS)],
+            "gallery_images": pillar.top_gallery_images,
+        }
+        for i, pillar in enumerate(db_pillars)
+    ]
 
-    formatted_projects = [
+
+def _home_projects():
+    return [
         {
             "title": p.title,
             "category": p.pillar.title if p.pillar else "Uncategorized",
             "image": p.image.url if p.image else "/static/images/placeholder.jpg",
             "description": p.short_description or p.description,
         }
-        for p in projects
+        for p in Project.objects.all().select_related('pillar')[:3]
     ]
 
-    projects = [
-        
-        {
-            "title": "Water Harvesting Systems",
-            "description": "Installing rainwater harvesting and spring protection systems in rural communities.",
-            "image": "/static/images/water-conservation.jpg",
-            "category": "Water & Sanitation",
-        },
-    ]
 
-    partners = Partner.objects.all()
+def _partners():
+    return list(Partner.objects.all())
 
+
+@conditional_public_page(Pillar, Gallery, Project, Partner)
+@cache_public_page
+def home(request):
+    context = {
+        # Lazy, so the queries are skipped when the cached fragments showing them are hit.
+        "pillars": SimpleLazyObject(_home_pillars),
+        "projects": _home_projects(),
+        "partners": SimpleLazyObject(_partners),
+    }
+    return render(request, "public/home.html", context)
+
+
+@conditional_public_page(Pillar, Gallery, Project, Partner)
+@cache_public_page
+async def home_async(request):
+    # The organization snapshot is loaded alongside so the context processor
+    # finds it cached when the template renders.
+    pillars, projects, partners, _ = await gather_queries(
+        _home_pillars, _home_projects, _partners, get_organization_snapshot,
+    )
     context = {
         "pillars": pillars,
-        "projects": formatted_projects,
+        "projects": projects,
         "partners": partners,
     }
-    return render(request, "public/home.html", context)
+    return await sync_to_async(render)(request, "public/home.html", context)
+
+
+SEARCH_PAGE_SIZE = 20
+
+
+@cache_public_page
+def search(request):
+    query = request.GET.get('q', '').strip()[:200]
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+
+    results, has_next = [], False
+    if query:
+        results, has_next = run_search(query, offset=(page - 1) * SEARCH_PAGE_SIZE, limit=SEARCH_PAGE_SIZE)
+
+    return render(request, "public/search.html", {
+        "query": query,
+        "results": results,
+        "page": page,
+        "has_next": has_next,
+    })
 
 
 @login_required
 def gallery_list(request):
-    galleries = Gallery.objects.all().order_by('-uploaded_at')
     context = {
         "title": "Gallery",
         "single_name": "Photo",
         "plural_name": "Gallery",
-        "headers": ["Image", "Title", "Event", "Project", "Uploaded"],
-        "fields": ["image", "title", "related_event", "related_project", "uploaded_at"],
-        "objects": galleries,
         "add_url": reverse("gallery_create"),
+        "bulk_add_url": reverse("gallery_bulk_upload"),
         "edit_base_url": reverse("gallery_update", args=[0]).replace("0/", ""),
         "delete_base_url": reverse("gallery_delete", args=[0]).replace("0/", ""),
+        **build_list_context(
+            request,
+            Gallery.objects.all(),
+            columns=[
+                {"header": "Image", "field": "image"},
+                {"header": "Title", "field": "title", "sortable": True},
+                {"header": "Event", "field": "related_event__title", "sortable": True},
+                {"header": "Project", "field": "related_project__title", "sortable": True},
+                {"header": "Uploaded", "field": "uploaded_at", "sortable": True},
+            ],
+            filters=[
+                {
+                    "param": "project",
+                    "field": "related_project",
+                    "label": "Project",
+                    "choices": list(Project.objects.order_by("title").values_list("id", "title")),
+                },
+            ],
+            default_sort="-uploaded_at",
+        ),
     }
     return render(request, "core/crud_list_base.html", context)
 
@@ -213,6 +464,32 @@ def gallery_create(request):
     })
 
 
+@login_required
+def gallery_bulk_upload(request):
+    if request.method == 'POST':
+        form = GalleryBulkUploadForm(request.POST, request.FILES)
+        if form.is_valid():
+            created, errors = bulk_create_gallery(
+                form.cleaned_data['images'],
+                title=form.cleaned_data['title'],
+                description=form.cleaned_data['description'],
+                related_pillar=form.cleaned_data['related_pillar'],
+                related_project=form.cleaned_data['related_project'],
+                related_event=form.cleaned_data['related_event'],
+            )
+            for error in errors:
+                messages.error(request, error)
+            messages.success(request, f"{len(created)} photo(s) uploaded successfully!")
+            return redirect('gallery_list')
+    else:
+        form = GalleryBulkUploadForm()
+    return render(request, 'core/crud_form_base.html', {
+        'title': 'Upload Photos',
+        'form': form,
+        'back_url': reverse('gallery_list'),
+    })
+
+
 @login_required
 def gallery_update(request, pk):
     gallery = get_object_or_404(Gallery, pk=pk)
@@ -248,17 +525,26 @@ def gallery_delete(request, pk):
 
 @login_required
 def partner_list(request):
-    partners = Partner.objects.all()
     context = {
         "title": "Partners",
         "single_name": "Partner",
         "plural_name": "Partners",
-        "headers": ["Name", "Type", "Website"],
-        "fields": ["name", "partner_type", "website"],
-        "objects": partners,
         "add_url": reverse("partner_create"),
         "edit_base_url": reverse("partner_update", args=[0]).replace("0/", ""),
         "delete_base_url": reverse("partner_delete", args=[0]).replace("0/", ""),
+        **build_list_context(
+            request,
+            Partner.objects.all(),
+            columns=[
+                {"header": "Name", "field": "name", "sortable": True},
+                {"header": "Type", "field": "partner_type", "sortable": True},
+                {"header": "Website", "field": "website"},
+            ],
+            filters=[
+                {"param": "type", "field": "partner_type", "label": "Type", "choices": Partner.TYPE_CHOICES},
+            ],
+            default_sort="name",
+        ),
     }
     return render(request, "core/crud_list_base.html", context)
 
@@ -314,17 +600,27 @@ def partner_delete(request, pk):
 
 @login_required
 def event_list(request):
-    events = Event.objects.all().order_by('-date')
     context = {
         "title": "Events",
         "single_name": "Event",
         "plural_name": "Events",
-        "headers": ["Title", "Date", "Location", "Status"],
-        "fields": ["title", "date", "location", "is_upcoming"],
-        "objects": events,
         "add_url": reverse("event_create"),
         "edit_base_url": reverse("event_update", args=[0]).replace("0/", ""),
         "delete_base_url": reverse("event_delete", args=[0]).replace("0/", ""),
+        **build_list_context(
+            request,
+            Event.objects.all(),
+            columns=[
+                {"header": "Title", "field": "title", "sortable": True},
+                {"header": "Date", "field": "date", "sortable": True},
+                {"header": "Location", "field": "location", "sortable": True},
+                {"header": "Status", "field": "is_upcoming"},
+            ],
+            filters=[
+                {"param": "upcoming", "field": "is_upcoming", "label": "Status", "choices": [("1", "Upcoming"), ("0", "Past")]},
+            ],
+            default_sort="-date",
+        ),
     }
     return render(request, "core/crud_list_base.html", context)
 
@@ -430,8 +726,30 @@ def pillar_delete(request, pk):
 
 @login_required
 def project_list(request):
-    projects = Project.objects.all().order_by('-start_date')
-    return render(request, "core/project_list.html", {"projects": projects})
+    context = {
+        "title": "Projects",
+        "single_name": "Project",
+        "plural_name": "Projects",
+        "add_url": reverse("project_create"),
+        "edit_base_url": reverse("project_update", args=[0]).replace("0/", ""),
+        "delete_base_url": reverse("project_delete", args=[0]).replace("0/", ""),
+        **build_list_context(
+            request,
+            Project.objects.all(),
+            columns=[
+                {"header": "Title", "field": "title", "sortable": True},
+                {"header": "Pillar", "field": "pillar__title", "sortable": True},
+                {"header": "Status", "field": "status", "sortable": True},
+                {"header": "Start", "field": "start_date", "sortable": True},
+                {"header": "End", "field": "end_date", "sortable": True},
+            ],
+            filters=[
+                {"param": "status", "field": "status", "label": "Status", "choices": Project.STATUS_CHOICES},
+            ],
+            default_sort="-start_date",
+        ),
+    }
+    return render(request, "core/crud_list_base.html", context)
 
 @login_required
 def project_create(request):
@@ -483,26 +801,72 @@ def project_delete(request, pk):
 
 @login_required
 def dashboard(request):
-    projects_count = Project.objects.count()
-    active_projects = Project.objects.filter(status="active").count()
-    completed_projects = Project.objects.filter(status="completed").count()
-    events_count = Event.objects.count()
-    partners_count = Partner.objects.count()
-    volunteers_count = VolunteerApplication.objects.count()
-    total_donations = Donation.objects.all().aggregate(total=models.Sum('amount'))['total'] or 0
+    # One conditional-aggregation query for the project figures
+    project_stats = Project.objects.aggregate(
+        total=models.Count('id'),
+        active=models.Count('id', filter=models.Q(status="active")),
+        completed=models.Count('id', filter=models.Q(status="completed")),
+    )
+    # Everything else comes from the incrementally maintained rollup row
+    stats = SiteStatistics.load()
+    period = request.GET.get("period", "day")
+    if period not in DonationRollup.PERIODS:
+        period = "day"
+    donations = donation_series(period)
 
     context = {
-        "projects_count": projects_count,
-        "active_projects": active_projects,
-        "completed_projects": completed_projects,
-        "events_count": events_count,
-        "partners_count": partners_count,
-        "volunteers_count": volunteers_count,
-        "total_donations": total_donations,
+        "projects_count": project_stats["total"],
+        "active_projects": project_stats["active"],
+        "completed_projects": project_stats["completed"],
+        "events_count": stats.events_count,
+        "partners_count": stats.partners_count,
+        "volunteers_count": stats.volunteers_count,
+        "total_donations": stats.donations_total,
+        "donation_period": period,
+        "donation_periods": DonationRollup.PERIOD_CHOICES,
+        "donation_legend": chart_legend(donations),
+        "donation_bars": chart_bars(donations),
+        "exports": [(name, model._meta.verbose_name_plural.capitalize()) for name, (model, _, _) in EXPORTS.items()],
     }
     return render(request, "core/dashboard.html", context)
 
 
+@login_required
+def donation_analytics(request):
+    """Donation totals per day/week/month bucket and method, for charts."""
+    period = request.GET.get("period", "day")
+    if period not in DonationRollup.PERIODS:
+        return JsonResponse({"error": "Invalid period."}, status=400)
+    series = donation_series(period)
+    return JsonResponse({
+        "period": period,
+        "methods": [{"key": key, "label": label} for key, label in series["methods"]],
+        "buckets": series["buckets"],
+    })
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff)
+def export(request, name):
+    return export_response(request, name)
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff)
+def metrics(request):
+    images = ProcessedImage.objects.aggregate(
+        count=models.Count('id'),
+        before=models.Sum('original_bytes'),
+        after=models.Sum('stored_bytes'),
+    )
+    images["saved"] = (images["before"] or 0) - (images["after"] or 0)
+    return render(request, "core/metrics.html", {
+        "rows": metrics_store.summary(),
+        "window_size": METRICS_WINDOW_SIZE,
+        "images": images,
+    })
+
+
 @login_required
 def general_info_view(request):
     # Singleton pattern: Get the first or create